@@ -0,0 +1,56 @@
+import json
+from typing import Dict, NamedTuple
+
+from eth_typing import ABI
+from eth_utils import event_signature_to_log_topic, function_signature_to_4byte_selector, keccak
+from eth_utils.abi import collapse_if_tuple
+
+
+class AbiSelectors(NamedTuple):
+    """Selector (or topic) -> signature tables of an ABI."""
+
+    functions: Dict[str, str]
+    events: Dict[str, str]
+    errors: Dict[str, str]
+
+
+def sort_abi(abi: ABI) -> ABI:
+    """Returns a copy of the ABI in the canonical registry order."""
+    sorted_abi = list(abi)
+    sorted_abi.sort(key=lambda d: (d["type"], d.get("name", "")))
+    return sorted_abi
+
+
+def abi_fingerprint(abi: ABI) -> str:
+    """Returns a content hash of the ABI which is independent of entry and key order."""
+    canonical_entries = sorted(json.dumps(d, sort_keys=True, separators=(",", ":")) for d in abi)
+    canonical_abi = "[" + ",".join(canonical_entries) + "]"
+    return "0x" + keccak(text=canonical_abi).hex()
+
+
+def abi_signature(abi_entry: Dict) -> str:
+    """Returns the canonical signature of a function, event or error ABI entry."""
+    input_types = ",".join(collapse_if_tuple(abi_input) for abi_input in abi_entry["inputs"])
+    return f"{abi_entry['name']}({input_types})"
+
+
+def abi_selectors(abi: ABI) -> AbiSelectors:
+    """
+    Returns the 4-byte function and error selectors and the event topics (topic0)
+    of an ABI, each mapped to its signature.
+    """
+    selectors = AbiSelectors(functions=dict(), events=dict(), errors=dict())
+    for abi_entry in abi:
+        entry_type = abi_entry["type"]
+        if entry_type not in ("function", "event", "error"):
+            continue
+        signature = abi_signature(abi_entry)
+        if entry_type == "event":
+            selectors.events["0x" + event_signature_to_log_topic(signature).hex()] = signature
+            continue
+        selector = "0x" + function_signature_to_4byte_selector(signature).hex()
+        if entry_type == "function":
+            selectors.functions[selector] = signature
+        else:
+            selectors.errors[selector] = signature
+    return selectors
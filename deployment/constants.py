@@ -1,7 +1,7 @@
 from enum import IntEnum
 from pathlib import Path
 
-from ape import project
+import ape
 
 import deployment
 
@@ -55,11 +55,14 @@ ADDITIONAL_TEMPORARY_TAPIR_NODES = {
 # Contracts
 #
 
-OZ_DEPENDENCY = project.dependencies["openzeppelin"]["5.0.0"]
+# OZ_DEPENDENCY: the OpenZeppelin 5.0.0 dependency project (see __getattr__ below)
 
 # EIP1967 Admin slot - https://eips.ethereum.org/EIPS/eip-1967#admin-address
 EIP1967_ADMIN_SLOT = 0xB53127684A568B3173AE13B9F8A6016E243E63B6E8EE1178D6A717850B5D6103
 
+# EIP1967 Implementation slot - https://eips.ethereum.org/EIPS/eip-1967#logic-contract-address
+EIP1967_IMPLEMENTATION_SLOT = 0x360894A13BA1A3210667C828492DB98DCA3E2076CC3735A920A3CA505D382BBC
+
 ACCESS_CONTROLLERS = ["GlobalAllowList", "OpenAccessAuthorizer", "ManagedAllowList"]
 
 #
@@ -98,3 +101,14 @@ class RitualState(IntEnum):
 
 
 HEARTBEAT_ARTIFACT_FILENAME = "heartbeat-rituals.json"
+
+# Multicall3 is deployed at the same address on (practically) every EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+
+def __getattr__(name: str):
+    # Resolving a dependency may install and compile it, so it is deferred to first use
+    # rather than paid by every script that imports this module.
+    if name == "OZ_DEPENDENCY":
+        return ape.project.dependencies["openzeppelin"]["5.0.0"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,83 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+
+from eth_typing import ChecksumAddress
+
+# EIP-170 runtime code size limit, and the EIP-3860 limit for initcode (twice as much)
+CODE_SIZE_LIMIT = 24576
+INITCODE_SIZE_LIMIT = 2 * CODE_SIZE_LIMIT
+
+# Fraction of a size limit above which a contract is reported as close to it
+SIZE_LIMIT_WARNING_RATIO = 0.9
+
+WEI_PER_GWEI = 10**9
+WEI_PER_ETHER = 10**18
+
+
+class CostReportStep(NamedTuple):
+    """Gas used (and, for deployments, code sizes) of a single deployment step."""
+
+    kind: str  # "deploy" or "transact"
+    name: str
+    address: ChecksumAddress
+    gas_used: int
+    code_size: Optional[int] = None
+    initcode_size: Optional[int] = None
+
+    @property
+    def warnings(self) -> List[str]:
+        warnings = list()
+        for size, limit, label in (
+            (self.code_size, CODE_SIZE_LIMIT, "code size"),
+            (self.initcode_size, INITCODE_SIZE_LIMIT, "initcode size"),
+        ):
+            if size is not None and size >= SIZE_LIMIT_WARNING_RATIO * limit:
+                warnings.append(f"{label} {size} bytes is {100 * size / limit:.1f}% of {limit}")
+        return warnings
+
+
+class DeploymentCostReport:
+    """Gas used by the steps of a (dry-run) deployment and its cost at a given gas price."""
+
+    def __init__(self):
+        self.steps: List[CostReportStep] = list()
+
+    def record(self, step: CostReportStep) -> None:
+        self.steps.append(step)
+
+    def label(self, address: ChecksumAddress, name: str) -> None:
+        """Renames the deployment step of the contract at the given address."""
+        for i, step in enumerate(self.steps):
+            if step.kind == "deploy" and step.address == address:
+                self.steps[i] = step._replace(name=name)
+
+    @property
+    def total_gas(self) -> int:
+        return sum(step.gas_used for step in self.steps)
+
+    def to_dict(self, gas_price: int) -> Dict[str, Any]:
+        """Returns the report with costs in wei at the given gas price (in wei)."""
+        return {
+            "gas_price": gas_price,
+            "total_gas": self.total_gas,
+            "total_cost": self.total_gas * gas_price,
+            "steps": [
+                dict(step._asdict(), cost=step.gas_used * gas_price, warnings=step.warnings)
+                for step in self.steps
+            ],
+        }
+
+    def format(self, gas_price: int) -> str:
+        """Returns a human-readable report at the given gas price (in wei)."""
+        lines = [f"Deployment cost at {gas_price / WEI_PER_GWEI:g} gwei:"]
+        for step in self.steps:
+            sizes = ""
+            if step.code_size is not None:
+                sizes = f", {step.code_size} bytes code, {step.initcode_size} bytes initcode"
+            lines.append(
+                f"\t{step.kind} {step.name}: {step.gas_used} gas "
+                f"({step.gas_used * gas_price / WEI_PER_ETHER:.6f} ETH){sizes}"
+            )
+            lines.extend(f"\t\tWARNING: {warning}" for warning in step.warnings)
+        total_cost = self.total_gas * gas_price / WEI_PER_ETHER
+        lines.append(f"Total: {self.total_gas} gas ({total_cost:.6f} ETH)")
+        return "\n".join(lines)
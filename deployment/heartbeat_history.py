@@ -0,0 +1,209 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Union
+
+HEARTBEAT_HISTORY_FILENAME = "heartbeat-history.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rituals (
+    domain TEXT NOT NULL,
+    ritual_id INTEGER NOT NULL,
+    heartbeat_round INTEGER NOT NULL,
+    period TEXT NOT NULL,  -- year and month of the heartbeat round, e.g. 2025-06
+    init_timestamp INTEGER NOT NULL,
+    state INTEGER NOT NULL,
+    block_number INTEGER,
+    evaluated_at REAL NOT NULL,
+    PRIMARY KEY (domain, ritual_id)
+);
+CREATE TABLE IF NOT EXISTS participants (
+    domain TEXT NOT NULL,
+    ritual_id INTEGER NOT NULL,
+    staker_address TEXT NOT NULL,
+    operator TEXT,
+    version TEXT,
+    probe_latency REAL,
+    eth_balance REAL,
+    PRIMARY KEY (domain, ritual_id, staker_address),
+    FOREIGN KEY (domain, ritual_id) REFERENCES rituals (domain, ritual_id)
+);
+CREATE TABLE IF NOT EXISTS offenses (
+    domain TEXT NOT NULL,
+    ritual_id INTEGER NOT NULL,
+    staker_address TEXT NOT NULL,
+    reason TEXT NOT NULL,
+    PRIMARY KEY (domain, ritual_id, staker_address, reason),
+    FOREIGN KEY (domain, ritual_id, staker_address)
+        REFERENCES participants (domain, ritual_id, staker_address)
+);
+CREATE INDEX IF NOT EXISTS offenses_by_staker ON offenses (domain, staker_address);
+"""
+
+
+class ParticipantRecord(NamedTuple):
+    """Evaluation of a heartbeat ritual participant."""
+
+    staker_address: str
+    version: Optional[str]
+    reasons: List[str]  # offense reasons, empty if the participant did not offend
+    probe_latency: Optional[float] = None
+    operator: Optional[str] = None
+    eth_balance: Optional[float] = None
+
+
+class RepeatOffender(NamedTuple):
+    staker_address: str
+    operator: Optional[str]
+    rituals: List[int]
+    reasons: List[str]
+
+
+class HeartbeatHistory:
+    """
+    SQLite store of evaluated heartbeat rituals: their participants, node versions and
+    probe latencies, and the offense reasons of each participant. Evaluated rituals are
+    not evaluated again, and repeat offenders are a query away.
+    """
+
+    def __init__(self, filepath: Union[Path, str] = HEARTBEAT_HISTORY_FILENAME):
+        self.filepath = filepath
+        self._connection = sqlite3.connect(str(filepath))
+        self._connection.execute("PRAGMA foreign_keys = ON")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "HeartbeatHistory":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def get_evaluated_rituals(self, domain: str, ritual_ids: Iterable[int]) -> Set[int]:
+        """Returns those of the given rituals which were evaluated before."""
+        ritual_ids = [int(ritual_id) for ritual_id in ritual_ids]
+        placeholders = ",".join("?" * len(ritual_ids))
+        rows = self._connection.execute(
+            f"SELECT ritual_id FROM rituals WHERE domain = ? AND ritual_id IN ({placeholders})",
+            (domain, *ritual_ids),
+        )
+        return {ritual_id for (ritual_id,) in rows}
+
+    def record_ritual(
+        self,
+        domain: str,
+        ritual_id: int,
+        heartbeat_round: int,
+        period: str,
+        init_timestamp: int,
+        state: int,
+        participants: List[ParticipantRecord],
+        block_number: Optional[int] = None,
+    ) -> None:
+        """Records (or replaces) the evaluation of a ritual, atomically."""
+        ritual_key = (domain, int(ritual_id))
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM offenses WHERE domain = ? AND ritual_id = ?", ritual_key
+            )
+            self._connection.execute(
+                "DELETE FROM participants WHERE domain = ? AND ritual_id = ?", ritual_key
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO rituals VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    *ritual_key,
+                    heartbeat_round,
+                    period,
+                    init_timestamp,
+                    state,
+                    block_number,
+                    time.time(),
+                ),
+            )
+            self._connection.executemany(
+                "INSERT INTO participants VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        *ritual_key,
+                        p.staker_address,
+                        p.operator,
+                        p.version,
+                        p.probe_latency,
+                        p.eth_balance,
+                    )
+                    for p in participants
+                ],
+            )
+            self._connection.executemany(
+                "INSERT INTO offenses VALUES (?, ?, ?, ?)",
+                [(*ritual_key, p.staker_address, r) for p in participants for r in p.reasons],
+            )
+
+    def get_offenders(self, domain: str, ritual_ids: Iterable[int]) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the offenders of the given (evaluated) rituals by staking provider,
+        in the format of the offender report.
+        """
+        ritual_ids = [int(ritual_id) for ritual_id in ritual_ids]
+        placeholders = ",".join("?" * len(ritual_ids))
+        rows = self._connection.execute(
+            f"""
+            SELECT p.staker_address, p.ritual_id, p.version, p.operator, p.eth_balance,
+                   json_group_array(o.reason)
+            FROM participants p
+            JOIN offenses o USING (domain, ritual_id, staker_address)
+            WHERE p.domain = ? AND p.ritual_id IN ({placeholders})
+            GROUP BY p.domain, p.ritual_id, p.staker_address
+            ORDER BY p.ritual_id
+            """,
+            (domain, *ritual_ids),
+        )
+        offenders = dict()
+        for staker_address, ritual_id, version, operator, eth_balance, reasons in rows:
+            offenders[staker_address] = {
+                "ritual": ritual_id,
+                "reasons": json.loads(reasons),
+                "version": version,
+                "operator": operator,
+                "eth_balance": eth_balance,
+            }
+        return offenders
+
+    def get_repeat_offenders(
+        self, domain: str, period: str, min_rituals: int = 2
+    ) -> List[RepeatOffender]:
+        """
+        Returns the staking providers which offended in at least `min_rituals` heartbeat
+        rituals of the given period (e.g. 2025-06), most frequent offenders first.
+        """
+        rows = self._connection.execute(
+            """
+            SELECT o.staker_address,
+                   (SELECT p.operator FROM participants p
+                    WHERE p.domain = o.domain AND p.staker_address = o.staker_address
+                          AND p.operator IS NOT NULL
+                    ORDER BY p.ritual_id DESC LIMIT 1),
+                   json_group_array(DISTINCT o.ritual_id),
+                   json_group_array(DISTINCT o.reason)
+            FROM offenses o
+            JOIN rituals r USING (domain, ritual_id)
+            WHERE o.domain = ? AND r.period = ?
+            GROUP BY o.staker_address
+            HAVING COUNT(DISTINCT o.ritual_id) >= ?
+            ORDER BY COUNT(DISTINCT o.ritual_id) DESC, o.staker_address
+            """,
+            (domain, period, min_rituals),
+        )
+        return [
+            RepeatOffender(
+                staker_address=staker_address,
+                operator=operator,
+                rituals=sorted(json.loads(rituals)),
+                reasons=sorted(json.loads(reasons)),
+            )
+            for staker_address, operator, rituals, reasons in rows
+        ]
@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+HTTP_CACHE_DIR_ENV = "NUCYPHER_CONTRACTS_HTTP_CACHE_DIR"
+HTTP_CACHE_OFFLINE_ENV = "NUCYPHER_CONTRACTS_OFFLINE"
+DEFAULT_HTTP_CACHE_DIR = Path.home() / ".cache" / "nucypher-contracts" / "http"
+
+# Seconds during which a cached response is used without revalidating it
+DEFAULT_TTL = 300
+
+
+class HttpCacheMiss(requests.RequestException):
+    """Raised in offline mode for requests which have no cached response."""
+
+
+class CacheEntry(NamedTuple):
+    url: str
+    fetched_at: float
+    headers: Dict[str, str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+class HttpCache:
+    """
+    On-disk cache of (successful) HTTP GET responses.
+
+    A cached response is used as is within its TTL, and revalidated with the server after
+    it (If-None-Match/If-Modified-Since), so an unchanged resource is not downloaded again.
+    If the server cannot be reached, the stale cached response is used. In offline mode
+    only cached responses are used, however old.
+
+    Only use it for resources that are the same for every request, not for e.g. random
+    node sampling, whose responses must never be reused.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, offline: Optional[bool] = None):
+        if directory is None:
+            directory = Path(os.environ.get(HTTP_CACHE_DIR_ENV, DEFAULT_HTTP_CACHE_DIR))
+        if offline is None:
+            offline = os.environ.get(HTTP_CACHE_OFFLINE_ENV, "").lower() in ("1", "true", "yes")
+        self.directory = Path(directory)
+        self.offline = offline
+        self._session = requests.Session()
+
+    @staticmethod
+    def _key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        request = json.dumps([url, sorted((params or dict()).items())], default=str)
+        return hashlib.sha256(request.encode()).hexdigest()
+
+    def _load(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self.directory / f"{key}.json", "r") as file:
+                return CacheEntry(**json.load(file))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def _store(self, key: str, entry: CacheEntry, content: Optional[bytes] = None) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if content is not None:
+            self._write_atomically(self.directory / f"{key}.body", content)
+        self._write_atomically(self.directory / f"{key}.json", json.dumps(entry._asdict()).encode())
+
+    @staticmethod
+    def _write_atomically(filepath: Path, content: bytes) -> None:
+        fd, temp_filepath = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp_filepath, filepath)
+        except BaseException:
+            Path(temp_filepath).unlink(missing_ok=True)
+            raise
+
+    def _cached_response(self, key: str, entry: CacheEntry) -> Optional[requests.Response]:
+        try:
+            with open(self.directory / f"{key}.body", "rb") as file:
+                content = file.read()
+        except OSError:
+            return None
+        response = requests.Response()
+        response.status_code = 200
+        response.url = entry.url
+        response.headers = CaseInsensitiveDict(entry.headers)
+        response._content = content
+        return response
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: float = DEFAULT_TTL,
+        headers: Optional[Dict[str, str]] = None,
+        **kwargs,
+    ) -> requests.Response:
+        """
+        Returns the response to a GET request, from the cache if it is fresh (or still
+        valid according to the server). Unsuccessful responses are returned but not cached.
+        """
+        key = self._key(url, params)
+        entry = self._load(key)
+        cached_response = self._cached_response(key, entry) if entry else None
+        if cached_response is not None:
+            if self.offline or time.time() - entry.fetched_at < ttl:
+                return cached_response
+        elif self.offline:
+            raise HttpCacheMiss(f"No cached response for {url} (offline mode)")
+
+        headers = dict(headers or dict())
+        if cached_response is not None:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        try:
+            response = self._session.get(url, params=params, headers=headers, **kwargs)
+        except requests.RequestException as e:
+            if cached_response is None:
+                raise
+            print(f"WARNING: Using the cached response for {url}: {e}")
+            return cached_response
+
+        if response.status_code == 304 and cached_response is not None:
+            self._store(key, entry._replace(fetched_at=time.time()))
+            return cached_response
+        if response.ok:
+            entry = CacheEntry(
+                url=response.url,
+                fetched_at=time.time(),
+                headers={"Content-Type": response.headers.get("Content-Type", "")},
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+            self._store(key, entry, response.content)
+        return response
+
+
+# Cache shared by everything in the process, created on first use
+_HTTP_CACHE: Optional[HttpCache] = None
+
+
+def get_http_cache() -> HttpCache:
+    """Returns the HTTP cache shared by the deployment package and scripts."""
+    global _HTTP_CACHE
+    if _HTTP_CACHE is None:
+        _HTTP_CACHE = HttpCache()
+    return _HTTP_CACHE
+
+
+def cached_get(url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
+    """GET request through the shared HTTP cache (see `HttpCache.get`)."""
+    return get_http_cache().get(url, params=params, **kwargs)
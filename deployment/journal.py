@@ -0,0 +1,115 @@
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional
+
+from ape import chain
+from eth_typing import ChecksumAddress
+from eth_utils import keccak, to_checksum_address, to_hex
+from hexbytes import HexBytes
+from web3.exceptions import TransactionNotFound
+
+JOURNAL_SUFFIX = ".journal.jsonl"
+
+
+class JournalEntry(NamedTuple):
+    """A completed deployment step."""
+
+    step: str
+    address: ChecksumAddress  # deployed contract, or transaction target
+    tx_hash: str
+
+
+class DeploymentJournal:
+    """
+    Append-only record of the completed steps (deployments and transactions) of a
+    deployment, used to resume a deployment that failed midway.
+
+    Steps are identified by their kind, their inputs (e.g. bytecode and resolved
+    constructor parameters) and how many identical steps came before them, so a rerun
+    of the same deployment script maps onto the same steps. A journaled step is only
+    trusted once its transaction receipt and, for deployments, the deployed code are
+    found on chain.
+
+    A journal without a filepath is kept in memory only (e.g. for dry runs).
+    """
+
+    DEPLOY = "deploy"
+    TRANSACT = "transact"
+
+    def __init__(self, filepath: Optional[Path]):
+        self.filepath = filepath
+        self._entries: Dict[str, JournalEntry] = dict()
+        self._occurrences: Dict[str, int] = defaultdict(int)
+        if filepath is not None and filepath.exists():
+            with open(filepath, "r") as file:
+                for line in file:
+                    try:
+                        entry = JournalEntry(**json.loads(line))
+                    except (ValueError, TypeError):
+                        # a partially written (last) line from an interrupted run
+                        continue
+                    self._entries[entry.step] = entry
+
+    @classmethod
+    def for_registry(cls, registry_filepath: Path) -> "DeploymentJournal":
+        """Returns the journal of the deployment published to the given registry file."""
+        return cls(registry_filepath.with_name(registry_filepath.stem + JOURNAL_SUFFIX))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def next_step(self, kind: str, *inputs: Any) -> str:
+        """Returns the identifier of the next step of the given kind with the given inputs."""
+        digest = keccak(text=json.dumps(inputs, default=str)).hex()
+        key = f"{kind}:{digest}"
+        occurrence = self._occurrences[key]
+        self._occurrences[key] += 1
+        return f"{key}:{occurrence}"
+
+    def get(self, step: str) -> Optional[JournalEntry]:
+        """Returns the journal entry of a completed step, if it can be reconciled on chain."""
+        entry = self._entries.get(step)
+        if entry is None:
+            return None
+        if not self._reconcile(entry):
+            print(f"WARNING: Ignoring journaled step at {entry.address}: not found on chain.")
+            del self._entries[step]
+            return None
+        return entry
+
+    def record(self, step: str, address: ChecksumAddress, tx_hash: str) -> None:
+        """Durably records a completed step."""
+        entry = JournalEntry(
+            step=step, address=to_checksum_address(address), tx_hash=to_hex(HexBytes(tx_hash))
+        )
+        if self.filepath is None:
+            self._entries[step] = entry
+            return
+        self.filepath.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.filepath, "a") as file:
+            file.write(json.dumps(entry._asdict()) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        self._entries[step] = entry
+
+    def remove(self) -> None:
+        """Removes the journal, e.g. once the deployment is published."""
+        if self.filepath is not None:
+            self.filepath.unlink(missing_ok=True)
+        self._entries.clear()
+
+    @classmethod
+    def _reconcile(cls, entry: JournalEntry) -> bool:
+        try:
+            receipt = chain.provider.web3.eth.get_transaction_receipt(entry.tx_hash)
+        except TransactionNotFound:
+            return False
+        if receipt["status"] != 1:
+            return False
+        if entry.step.startswith(cls.DEPLOY):
+            if receipt["contractAddress"] != entry.address:
+                return False
+            return len(chain.provider.get_code(entry.address)) > 0
+        return receipt["to"] == entry.address
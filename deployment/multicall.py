@@ -0,0 +1,108 @@
+from typing import TYPE_CHECKING, Any, List, NamedTuple, Optional, Tuple, Union
+
+import ape
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, to_hex
+from hexbytes import HexBytes
+
+from deployment.constants import MULTICALL3_ADDRESS
+from deployment.utils import batch_rpc_requests
+
+if TYPE_CHECKING:
+    from ape.contracts import ContractInstance
+
+MULTICALL3_AGGREGATE3_SELECTOR = function_signature_to_4byte_selector(
+    "aggregate3((address,bool,bytes)[])"
+)
+
+# Number of calls aggregated per eth_call, to stay below node gas caps of eth_call
+MULTICALL_CHUNK_SIZE = 200
+
+BlockIdentifier = Union[int, str]
+
+
+class ContractRead(NamedTuple):
+    """A view call of a contract method, by name, as aggregated by `multicall`."""
+
+    contract: "ContractInstance"
+    method: str
+    args: Tuple[Any, ...] = ()
+
+
+def get_block_number(block_identifier: BlockIdentifier = "latest") -> int:
+    """Returns the number of a block, e.g. to pin several batched reads to it."""
+    if isinstance(block_identifier, int):
+        return block_identifier
+    return ape.chain.provider.get_block(block_identifier).number
+
+
+def _to_block_parameter(block_identifier: BlockIdentifier) -> str:
+    return block_identifier if isinstance(block_identifier, str) else hex(block_identifier)
+
+
+def _select_abi(read: ContractRead):
+    handler = getattr(read.contract, read.method)
+    for abi in handler.abis:
+        if len(abi.inputs) == len(read.args):
+            return abi
+    raise ValueError(f"No ABI for {read.method} with {len(read.args)} argument(s).")
+
+
+def multicall(
+    reads: List[ContractRead],
+    block_identifier: BlockIdentifier = "latest",
+    chunk_size: int = MULTICALL_CHUNK_SIZE,
+) -> List[Optional[Any]]:
+    """
+    Executes the view calls with Multicall3 `aggregate3` at the given block and returns
+    their decoded results in order (None for calls which reverted). Results are unwrapped
+    like ape's contract calls, e.g. the single return value of a method is returned as is.
+
+    Calls are aggregated in chunks, all of which are sent as a single JSON-RPC batch.
+    """
+    if not reads:
+        return []
+
+    ecosystem = ape.networks.provider.network.ecosystem
+    abis = [_select_abi(read) for read in reads]
+    aggregated_calls = [
+        (
+            read.contract.address,
+            True,  # allow failure
+            bytes(ecosystem.get_method_selector(abi))
+            + bytes(ecosystem.encode_calldata(abi, *read.args)),
+        )
+        for read, abi in zip(reads, abis)
+    ]
+
+    block = _to_block_parameter(block_identifier)
+    rpc_calls = list()
+    for start in range(0, len(aggregated_calls), chunk_size):
+        calldata = MULTICALL3_AGGREGATE3_SELECTOR + encode(
+            ["(address,bool,bytes)[]"], [aggregated_calls[start : start + chunk_size]]
+        )
+        rpc_calls.append(
+            ("eth_call", [{"to": MULTICALL3_ADDRESS, "data": to_hex(calldata)}, block])
+        )
+    responses = batch_rpc_requests(rpc_calls)
+
+    results = list()
+    for response in responses:
+        (chunk_results,) = decode(["(bool,bytes)[]"], HexBytes(response))
+        results.extend(chunk_results)
+
+    values = list()
+    for abi, (success, return_data) in zip(abis, results):
+        if not success:
+            values.append(None)
+            continue
+        output = ecosystem.decode_returndata(abi, return_data)
+        values.append(output[0] if len(output) == 1 else output)
+    return values
+
+
+def get_balances(addresses: List[str], block_identifier: BlockIdentifier = "latest") -> List[int]:
+    """Returns the native token balances (in wei) of the addresses in one JSON-RPC batch."""
+    block = _to_block_parameter(block_identifier)
+    results = batch_rpc_requests([("eth_getBalance", [address, block]) for address in addresses])
+    return [int(result, 16) if isinstance(result, str) else int(result) for result in results]
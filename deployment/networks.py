@@ -1,5 +1,5 @@
-from ape import networks
+import ape
 
 
 def is_local_network():
-    return networks.network.name in ["local"]
+    return ape.networks.network.name in ["local"]
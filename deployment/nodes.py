@@ -0,0 +1,165 @@
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+import requests
+import urllib3
+
+# Nodes serve their status over TLS with self-signed certificates
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+NODE_STATUS_CONNECT_TIMEOUT = 5
+NODE_STATUS_READ_TIMEOUT = 15
+NODE_STATUS_DEADLINE = 120
+NODE_STATUS_MAX_WORKERS = 32
+
+
+class NodeStatus(NamedTuple):
+    """Outcome of probing the status endpoint of a node."""
+
+    rest_url: str
+    version: Optional[str]  # None if the node is unreachable
+    error: Optional[str] = None
+    latency: Optional[float] = None  # seconds until the node answered, if it did
+
+    @property
+    def reachable(self) -> bool:
+        return self.version is not None
+
+
+def _get_node_status(session: requests.Session, rest_url: str, scheme: str, timeout) -> NodeStatus:
+    start = time.monotonic()
+    try:
+        response = session.get(
+            f"{scheme}://{rest_url}/status/",
+            params={"json": "true"},
+            verify=False,
+            timeout=timeout,
+        )
+        # check for HTTP errors (4xx and 5xx)
+        response.raise_for_status()
+        version = response.json().get("version")
+    except (requests.RequestException, ValueError) as e:
+        return NodeStatus(rest_url=rest_url, version=None, error=str(e))
+    latency = time.monotonic() - start
+    if version is None:
+        error = "No version in node status"
+        return NodeStatus(rest_url=rest_url, version=None, error=error, latency=latency)
+    return NodeStatus(rest_url=rest_url, version=version, latency=latency)
+
+
+def probe_node_statuses(
+    rest_urls: Iterable[str],
+    connect_timeout: float = NODE_STATUS_CONNECT_TIMEOUT,
+    read_timeout: float = NODE_STATUS_READ_TIMEOUT,
+    deadline: float = NODE_STATUS_DEADLINE,
+    max_workers: int = NODE_STATUS_MAX_WORKERS,
+    scheme: str = "https",
+) -> Dict[str, NodeStatus]:
+    """
+    Probes the status endpoints of the given nodes concurrently, each distinct node once,
+    over a pooled session. Nodes which fail, time out, or have not answered by the
+    overall deadline (in seconds) are reported as unreachable.
+    """
+    rest_urls = list(dict.fromkeys(rest_urls))
+    if not rest_urls:
+        return dict()
+
+    max_workers = min(max_workers, len(rest_urls))
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    statuses = dict()
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {
+            executor.submit(
+                _get_node_status, session, rest_url, scheme, (connect_timeout, read_timeout)
+            ): rest_url
+            for rest_url in rest_urls
+        }
+        pending = set(futures)
+        expires_at = time.monotonic() + deadline
+        while pending:
+            remaining = expires_at - time.monotonic()
+            if remaining <= 0:
+                break
+            done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+            for future in done:
+                status = future.result()
+                statuses[status.rest_url] = status
+        for future in pending:
+            rest_url = futures[future]
+            statuses[rest_url] = NodeStatus(
+                rest_url=rest_url, version=None, error=f"No answer within {deadline}s"
+            )
+    finally:
+        # do not wait for probes still running past the deadline
+        executor.shutdown(wait=False, cancel_futures=True)
+        session.close()
+    return {rest_url: statuses[rest_url] for rest_url in rest_urls}
+
+
+class KnownNodes:
+    """
+    The known nodes of a seednode status payload, indexed by staking provider and operator
+    address (case insensitive). Node versions are probed on demand and memoized, so a node
+    is probed at most once however many heartbeat cohorts it is part of.
+    """
+
+    def __init__(self, network_data: Dict[str, Any], **probe_options):
+        self.network_data = network_data
+        self._probe_options = probe_options
+        self._by_staker: Dict[str, Dict[str, Any]] = dict()
+        self._by_operator: Dict[str, Dict[str, Any]] = dict()
+        for node in network_data.get("known_nodes", []):
+            # the first entry of a node wins, as in a scan of the payload
+            if node.get("staker_address"):
+                self._by_staker.setdefault(node["staker_address"].lower(), node)
+            if node.get("operator_address"):
+                self._by_operator.setdefault(node["operator_address"].lower(), node)
+        self._statuses: Dict[str, NodeStatus] = dict()
+
+    def __len__(self) -> int:
+        return len(self._by_staker)
+
+    def get(self, staker_address: str) -> Optional[Dict[str, Any]]:
+        """Returns the known node of a staking provider, if any."""
+        return self._by_staker.get(staker_address.lower())
+
+    def get_by_operator(self, operator_address: str) -> Optional[Dict[str, Any]]:
+        """Returns the known node of an operator, if any."""
+        return self._by_operator.get(operator_address.lower())
+
+    def get_versions(self, staker_addresses: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Returns the versions of the nodes of the given staking providers (None if unknown or
+        unreachable), probing the nodes which were not probed before concurrently.
+        """
+        seednode_staker = (self.network_data.get("staker_address") or "").lower()
+        rest_urls = dict()
+        for staker_address in staker_addresses:
+            node = self.get(staker_address)
+            if staker_address.lower() != seednode_staker and node:
+                rest_urls[staker_address] = node["rest_url"]
+
+        unprobed = [url for url in rest_urls.values() if url not in self._statuses]
+        self._statuses.update(probe_node_statuses(unprobed, **self._probe_options))
+
+        versions = dict()
+        for staker_address in staker_addresses:
+            if staker_address.lower() == seednode_staker:
+                # the node that provided the network data
+                versions[staker_address] = self.network_data.get("version")
+            elif staker_address in rest_urls:
+                versions[staker_address] = self._statuses[rest_urls[staker_address]].version
+            else:
+                versions[staker_address] = None
+        return versions
+
+    def get_status(self, staker_address: str) -> Optional[NodeStatus]:
+        """Returns the memoized probe status of the node of a staking provider, if probed."""
+        node = self.get(staker_address)
+        return self._statuses.get(node["rest_url"]) if node else None
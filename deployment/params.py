@@ -1,6 +1,8 @@
+import functools
 import typing
 from abc import ABC, abstractmethod
 from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, List
 
@@ -11,17 +13,21 @@ from ape.contracts.base import ContractContainer, ContractInstance, ContractTran
 from ape.utils import EMPTY_BYTES32, ZERO_ADDRESS
 from ape_test import TestAccount
 from eth_typing import ChecksumAddress
-from eth_utils import to_checksum_address
+from eth_utils import to_checksum_address, to_hex
 from ethpm_types import MethodABI
 from web3.auto import w3
 
+import deployment.constants
 from deployment.confirm import _confirm_resolution, _continue
-from deployment.constants import EIP1967_ADMIN_SLOT, OZ_DEPENDENCY
-from deployment.registry import registry_from_ape_deployments
+from deployment.constants import EIP1967_ADMIN_SLOT
+from deployment.costs import CostReportStep, DeploymentCostReport
+from deployment.journal import DeploymentJournal
+from deployment.registry import invalidate_proxy_info, registry_from_ape_deployments
 from deployment.utils import (
     _load_yaml,
     check_plugins,
     get_contract_container,
+    is_local_network,
     validate_config,
     verify_contracts,
 )
@@ -112,7 +118,11 @@ class Encode(Variable):
         specific_method_abis = [abi for abi in contract_method_abis if abi.name == method_name]
 
         resolved_method_args = [_resolve_param(method_arg) for method_arg in method_args]
-        _validate_method_args(method_abis=specific_method_abis, args=resolved_method_args)
+        _validate_method_args(
+            contract_name=contract_name,
+            method_abis=specific_method_abis,
+            args=resolved_method_args,
+        )
 
         return method_name, method_args
 
@@ -135,6 +145,53 @@ class Encode(Variable):
         return encoded_bytes.hex()  # return as hex - just cleaner
 
 
+# Reverse index of the proxies known to this process: proxy target -> proxy address
+_PROXY_BY_TARGET: typing.Dict[ChecksumAddress, ChecksumAddress] = dict()
+_TARGET_BY_PROXY: typing.Dict[ChecksumAddress, ChecksumAddress] = dict()
+
+# Addresses detected by ape as proxies that were already indexed (or were not proxies)
+_SCANNED_PROXIES: typing.Set[ChecksumAddress] = set()
+
+
+def _index_proxy(proxy_address: ChecksumAddress, target_address: ChecksumAddress) -> None:
+    """Records (or updates, e.g. after an upgrade) the target of a proxy."""
+    _record_proxy(to_checksum_address(proxy_address), to_checksum_address(target_address))
+
+
+def _record_proxy(proxy_address: ChecksumAddress, target_address: ChecksumAddress) -> None:
+    previous_target = _TARGET_BY_PROXY.get(proxy_address)
+    if previous_target and _PROXY_BY_TARGET.get(previous_target) == proxy_address:
+        del _PROXY_BY_TARGET[previous_target]
+    _TARGET_BY_PROXY[proxy_address] = target_address
+    _PROXY_BY_TARGET[target_address] = proxy_address
+
+
+def _get_proxy_address(target_address: ChecksumAddress) -> typing.Optional[ChecksumAddress]:
+    """
+    Returns the address of the proxy targeting the given contract, if any. Proxies
+    detected by ape (but not deployed by this process) are indexed on a lookup miss;
+    each one only once, so a miss is O(1) unless ape detected new proxies since.
+    """
+    proxy_address = _PROXY_BY_TARGET.get(target_address)
+    if proxy_address is not None:
+        return proxy_address
+
+    proxy_infos = chain.contracts.proxy_infos.memory
+    if len(proxy_infos) != len(_SCANNED_PROXIES):
+        for proxy_address in list(proxy_infos.keys()):
+            if proxy_address in _SCANNED_PROXIES:
+                continue
+            _SCANNED_PROXIES.add(proxy_address)
+            if proxy_address in _TARGET_BY_PROXY:
+                continue
+            proxy_info = chain.contracts.get_proxy_info(proxy_address)
+            if proxy_info:
+                # ape keeps (and validates) addresses in checksum format
+                _record_proxy(proxy_address, proxy_info.target)
+
+    return _PROXY_BY_TARGET.get(target_address)
+
+
 class ContractName(Variable):
     def __init__(self, contract_name: str, context: VariableContext):
         if contract_name not in context.contract_names:
@@ -153,11 +210,9 @@ class ContractName(Variable):
 
         if self.check_for_proxy_instances:
             # check if contract is proxied - if so return proxy contract instead
-            proxy_info_keys = chain.contracts.proxy_infos.memory.keys()
-            for proxy_address in proxy_info_keys:
-                proxy_info = chain.contracts.get_proxy_info(proxy_address)
-                if proxy_info and proxy_info.target == contract_instance.address:
-                    return proxy_address
+            proxy_address = _get_proxy_address(contract_instance.address)
+            if proxy_address is not None:
+                return proxy_address
 
         return contract_instance.address
 
@@ -240,20 +295,54 @@ def _get_contract_names(config: typing.Dict) -> List[str]:
     return contract_names
 
 
+ArgValidator = typing.Tuple[str, str, typing.Callable[[Any], bool]]  # name, type, validator
+
+# Validators of the overloads of a contract method, keyed by contract name, method name and
+# number of arguments (bounded by the methods of the project's contracts)
+_OVERLOAD_CANDIDATES: typing.Dict[
+    typing.Tuple[str, str, int], List[typing.Tuple[ArgValidator, ...]]
+] = dict()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_type_validator(abi_type: str) -> typing.Callable[[Any], bool]:
+    """Returns a validator of python values against an ABI type."""
+    return functools.partial(w3.codec.is_encodable, abi_type)
+
+
+def _compile_validators(abi_inputs: List[Any]) -> typing.Tuple[ArgValidator, ...]:
+    """Returns the argument validators of a list of ABI inputs."""
+    return tuple(
+        (abi_input.name, abi_input.type, _get_type_validator(abi_input.type))
+        for abi_input in abi_inputs
+    )
+
+
+def _get_overload_candidates(
+    contract_name: str, method_abis: List[MethodABI], args_count: int
+) -> List[typing.Tuple[ArgValidator, ...]]:
+    """Returns the (cached) validators of the method overloads taking `args_count` arguments."""
+    key = (contract_name, method_abis[0].name, args_count)
+    if key not in _OVERLOAD_CANDIDATES:
+        _OVERLOAD_CANDIDATES[key] = [
+            _compile_validators(abi.inputs) for abi in method_abis if len(abi.inputs) == args_count
+        ]
+    return _OVERLOAD_CANDIDATES[key]
+
+
 def _validate_method_args(
-    method_abis: List[MethodABI], args: typing.Sequence[Any]
+    contract_name: str, method_abis: List[MethodABI], args: typing.Sequence[Any]
 ) -> typing.Dict[str, Any]:
     """Validates the transaction arguments against the function ABI."""
     if len(method_abis) == 0:
         raise ValueError("No method abis provided for validation of args")
 
-    abis_matching_args_length = [abi for abi in method_abis if len(abi.inputs) == len(args)]
-    for abi in abis_matching_args_length:
+    for validators in _get_overload_candidates(contract_name, method_abis, len(args)):
         named_args = {}
-        for arg, abi_input in zip(args, abi.inputs):
-            if not w3.is_encodable(abi_input.type, arg):
+        for arg, (name, _, is_encodable) in zip(args, validators):
+            if not is_encodable(arg):
                 break
-            named_args[abi_input.name] = arg
+            named_args[name] = arg
         else:
             return named_args
     raise ValueError(
@@ -275,21 +364,22 @@ def _validate_constructor_abi_inputs(
     if not abi_inputs:
         return  # no constructor parameters
 
-    codex = enumerate(zip(abi_inputs, resolved_parameters.items()), start=0)
-    for position, (abi_input, resolved_input) in codex:
+    validators = _compile_validators(abi_inputs)
+    codex = enumerate(zip(validators, resolved_parameters.items()), start=0)
+    for position, ((abi_name, abi_type, is_encodable), resolved_input) in codex:
         name, value = resolved_input
         # validate name
-        if abi_input.name != name:
+        if abi_name != name:
             raise ConstructorParameters.Invalid(
                 f"{contract_name} constructor parameter '{name}' at position {position} does not "
-                f"match the expected ABI name '{abi_input.name}'."
+                f"match the expected ABI name '{abi_name}'."
             )
 
         # validate value type
-        if not w3.is_encodable(abi_input.type, value):
+        if not is_encodable(value):
             raise ConstructorParameters.Invalid(
                 f"Constructor param name '{name}' at position {position} has a value '{value}' "
-                f"whose type does not match expected ABI type '{abi_input.type}'"
+                f"whose type does not match expected ABI type '{abi_type}'"
             )
 
 
@@ -366,7 +456,7 @@ class ConstructorParameters:
 
 def validate_proxy_info(contracts_proxy_info) -> None:
     """Validates the proxy information for all contracts."""
-    contract_container = OZ_DEPENDENCY.TransparentUpgradeableProxy
+    contract_container = deployment.constants.OZ_DEPENDENCY.TransparentUpgradeableProxy
     for contract, proxy_info in contracts_proxy_info.items():
         resolved_parameters = _resolve_params(proxy_info.constructor_params)
         _validate_constructor_abi_inputs(
@@ -477,6 +567,142 @@ class ProxyParameters:
         return default_parameters
 
 
+def _get_dependencies(value: Any) -> typing.Set[str]:
+    """Returns the names of the contracts referenced by a processed parameter value."""
+    if isinstance(value, list):
+        return set().union(*(_get_dependencies(v) for v in value))
+    if isinstance(value, ContractName):
+        return {value.contract_name}
+    if isinstance(value, Encode):
+        return _get_dependencies(value.method_args)
+    return set()
+
+
+class DeploymentPlan:
+    """
+    Represents the order in which the contracts of a deployment config can be deployed,
+    derived from the contract references in their constructor and proxy parameters.
+    Contracts in the same stage do not depend on each other.
+    """
+
+    class Cycle(Exception):
+        """Raised when contracts (transitively) reference each other"""
+
+    def __init__(self, dependencies: OrderedDict):
+        self.dependencies = dependencies
+        self.stages = self._get_stages(dependencies)
+
+    @classmethod
+    def from_parameters(
+        cls, constructor_parameters: ConstructorParameters, proxy_parameters: ProxyParameters
+    ) -> "DeploymentPlan":
+        """Builds the deployment plan from the contract references in the parameters."""
+        dependencies = OrderedDict()
+        for contract_name, parameters in constructor_parameters.parameters.items():
+            contract_dependencies = _get_dependencies(list(parameters.values()))
+            proxy_info = proxy_parameters.contracts_proxy_info.get(contract_name)
+            if proxy_info:
+                proxy_params = list(proxy_info.constructor_params.values())
+                contract_dependencies |= _get_dependencies(proxy_params)
+            # the proxy '_logic' parameter references the contract being proxied
+            contract_dependencies.discard(contract_name)
+            dependencies[contract_name] = contract_dependencies
+        return cls(dependencies=dependencies)
+
+    @classmethod
+    def _get_stages(cls, dependencies: OrderedDict) -> List[List[str]]:
+        """Topologically sorts the contracts into stages, preserving config order within each."""
+        dependents = {contract_name: list() for contract_name in dependencies}
+        pending_dependencies = dict()
+        for contract_name, contract_dependencies in dependencies.items():
+            pending_dependencies[contract_name] = len(contract_dependencies)
+            for dependency in contract_dependencies:
+                dependents[dependency].append(contract_name)
+
+        stages = list()
+        stage = [name for name, pending in pending_dependencies.items() if not pending]
+        while stage:
+            stages.append(stage)
+            next_stage = list()
+            for contract_name in stage:
+                for dependent in dependents[contract_name]:
+                    pending_dependencies[dependent] -= 1
+                    if not pending_dependencies[dependent]:
+                        next_stage.append(dependent)
+            stage = [name for name in dependencies if name in next_stage]
+
+        if sum(len(stage) for stage in stages) != len(dependencies):
+            cyclic = [name for name, pending in pending_dependencies.items() if pending]
+            raise cls.Cycle(f"Contracts {', '.join(cyclic)} have circular references.")
+        return stages
+
+    @property
+    def order(self) -> List[str]:
+        """Returns the contract names in deployment order."""
+        return [contract_name for stage in self.stages for contract_name in stage]
+
+    def __str__(self) -> str:
+        lines = list()
+        for i, stage in enumerate(self.stages, start=1):
+            lines.append(f"Stage {i}:")
+            for contract_name in stage:
+                dependencies = ", ".join(sorted(self.dependencies[contract_name])) or "-"
+                lines.append(f"\t{contract_name} (depends on: {dependencies})")
+        return "\n".join(lines)
+
+
+class BatchCall:
+    """A transaction collected by a `TransactionBatch`, and its receipt once submitted."""
+
+    def __init__(self, method: ContractTransactionHandler, args: typing.Tuple[Any, ...]):
+        self.method = method
+        self.args = args
+        self.named_args = _validate_method_args(
+            contract_name=method.contract.contract_type.name,
+            method_abis=method.abis,
+            args=args,
+        )
+        self.receipt: typing.Optional[ReceiptAPI] = None
+
+    def __str__(self) -> str:
+        base_message = (
+            f"{self.method.contract.contract_type.name}"
+            f"[{self.method.contract.address[:10]}].{self.method}"
+        )
+        if not self.named_args:
+            return f"{base_message} with no arguments"
+        pretty_args = "\n\t".join(f"{k}={v}" for k, v in self.named_args.items())
+        return f"{base_message} with arguments:\n\t{pretty_args}"
+
+
+class TransactionBatch:
+    """
+    Transactions collected by `Transactor.batch()`: each call is validated when it is
+    added, and all of them are submitted together (after a single confirmation) when
+    the batch context exits without an error.
+    """
+
+    def __init__(self, transactor: "Transactor"):
+        self._transactor = transactor
+        self.calls: List[BatchCall] = list()
+
+    def transact(self, method: ContractTransactionHandler, *args) -> BatchCall:
+        call = BatchCall(method, args)
+        self.calls.append(call)
+        return call
+
+    @property
+    def receipts(self) -> List[ReceiptAPI]:
+        return [call.receipt for call in self.calls]
+
+    def __enter__(self) -> "TransactionBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self._transactor.transact_batch(self.calls)
+
+
 class Transactor:
     """
     Represents an ape account plus validated/annotated transaction execution.
@@ -492,23 +718,21 @@ class Transactor:
         self._autosign = autosign
         if not isinstance(self._account, (TestAccount, ImpersonatedAccount)):
             self._account.set_autosign(autosign)
+        self._journal: typing.Optional[DeploymentJournal] = None
+        self.cost_report: typing.Optional[DeploymentCostReport] = None
 
     def get_account(self) -> AccountAPI:
         """Returns the transactor account."""
         return self._account
 
     def transact(self, method: ContractTransactionHandler, *args) -> ReceiptAPI:
-        named_args = _validate_method_args(method_abis=method.abis, args=args)
-        base_message = (
-            f"\nTransacting {method.contract.contract_type.name}"
-            f"[{method.contract.address[:10]}].{method}"
-        )
-        if named_args:
-            pretty_args = "\n\t".join(f"{k}={v}" for k, v in named_args.items())
-            message = f"{base_message} with arguments:\n\t{pretty_args}"
-        else:
-            message = f"{base_message} with no arguments"
-        print(message)
+        call = BatchCall(method, args)
+        step = self._next_transaction_step(call)
+        receipt = self._restore_transaction(call, step)
+        if receipt is not None:
+            return receipt
+
+        print(f"\nTransacting {call}")
         if not self._autosign:
             _continue()
 
@@ -519,13 +743,139 @@ class Transactor:
             # max_priority_fee="3 gwei",
             # max_fee="120 gwei"
         )
+        self._record_transaction(call, step, result)
         return result
 
+    def batch(self) -> TransactionBatch:
+        """
+        Returns a batch to collect transactions in, submitted together on exiting its context:
+
+            with transactor.batch() as batch:
+                for operator in operators:
+                    batch.transact(contract.confirmOperatorAddress, operator)
+            receipts = batch.receipts
+        """
+        return TransactionBatch(self)
+
+    def transact_batch(self, calls: List[BatchCall]) -> List[ReceiptAPI]:
+        """
+        Submits the (already validated) calls after a single confirmation. The calls are
+        broadcast back-to-back with consecutive, locally assigned nonces and their receipts
+        are awaited concurrently; each receipt is set on its originating call.
+
+        Calls are prepared (and their gas estimated) before any of them is mined, so a call
+        which depends on the effects of an earlier call belongs in a later batch.
+
+        The calls are not bundled into a multicall: a multicall contract would become
+        their `msg.sender`, which breaks the owner and role gated calls being batched.
+        """
+        steps = [self._next_transaction_step(call) for call in calls]
+        for call, step in zip(calls, steps):
+            call.receipt = self._restore_transaction(call, step)
+        pending = [i for i, call in enumerate(calls) if call.receipt is None]
+        if not pending:
+            return [call.receipt for call in calls]
+
+        self._confirm_calls([calls[i] for i in pending])
+
+        account = self.get_account()
+        if isinstance(account, ImpersonatedAccount):
+            # impersonated accounts cannot sign, so their transactions are sent one by one
+            for i in pending:
+                receipt = calls[i].method(*calls[i].args, sender=account)
+                self._record_transaction(calls[i], steps[i], receipt)
+            return [call.receipt for call in calls]
+
+        nonce = account.nonce
+        txn_hashes = list()
+        for i in pending:
+            txn = calls[i].method.as_transaction(
+                *calls[i].args, sender=account, nonce=nonce, sign=True
+            )
+            txn_hashes.append(self._send_signed_transaction(txn))
+            print(f"Broadcast {calls[i].method} (nonce {nonce}): {txn_hashes[-1]}")
+            nonce += 1
+
+        for i, receipt in zip(pending, self._await_receipts(txn_hashes)):
+            receipt.raise_for_status()
+            self._record_transaction(calls[i], steps[i], receipt)
+        return [call.receipt for call in calls]
+
+    def _confirm_calls(self, calls: List[BatchCall]) -> None:
+        """Shows the calls about to be submitted and asks (once) to continue."""
+        pretty_calls = "\n".join(f"{n}. {call}" for n, call in enumerate(calls, 1))
+        print(f"\nTransacting a batch of {len(calls)} transactions:\n{pretty_calls}")
+        if not self._autosign:
+            _continue()
+
+    def _next_transaction_step(self, call: BatchCall) -> typing.Optional[str]:
+        """Returns the journal step of the next transaction of the given call, if journaled."""
+        if self._journal is None:
+            return None
+        return self._journal.next_step(
+            DeploymentJournal.TRANSACT, call.method.contract.address, str(call.method), call.args
+        )
+
+    def _restore_transaction(
+        self, call: BatchCall, step: typing.Optional[str]
+    ) -> typing.Optional[ReceiptAPI]:
+        """Returns the receipt of the transaction of a journaled step, if any."""
+        if step is None:
+            return None
+        entry = self._journal.get(step)
+        if entry is None:
+            return None
+        print(
+            f"\nSkipping {call.method.contract.contract_type.name}"
+            f"[{call.method.contract.address[:10]}].{call.method}: "
+            f"completed in {entry.tx_hash} according to the deployment journal."
+        )
+        return chain.provider.get_receipt(entry.tx_hash)
+
+    def _record_transaction(
+        self, call: BatchCall, step: typing.Optional[str], receipt: ReceiptAPI
+    ) -> None:
+        call.receipt = receipt
+        if step is not None:
+            self._journal.record(step, call.method.contract.address, receipt.txn_hash)
+        if self.cost_report is not None:
+            self.cost_report.record(
+                CostReportStep(
+                    kind="transact",
+                    name=f"{call.method.contract.contract_type.name}.{call.method}",
+                    address=call.method.contract.address,
+                    gas_used=receipt.gas_used,
+                )
+            )
+
+    @staticmethod
+    def _send_signed_transaction(signed_txn) -> str:
+        """Broadcasts a signed transaction without waiting for its receipt."""
+        raw_txn = signed_txn.serialize_transaction()
+        return to_hex(chain.provider.web3.eth.send_raw_transaction(raw_txn))
+
+    @staticmethod
+    def _await_receipts(txn_hashes: List[str]) -> List[ReceiptAPI]:
+        """Awaits the receipts of the broadcast transactions concurrently."""
+        required_confirmations = chain.provider.network.required_confirmations
+        with ThreadPoolExecutor(max_workers=len(txn_hashes)) as executor:
+            return list(
+                executor.map(
+                    lambda txn_hash: chain.provider.get_receipt(
+                        txn_hash, required_confirmations=required_confirmations
+                    ),
+                    txn_hashes,
+                )
+            )
+
 
 class Deployer(Transactor):
     """
     Represents an ape account plus
     deployment parameters for a set of contracts, plus validated/annotated execution.
+
+    A dry run executes the deployment on a local network without publishing it,
+    recording the gas used and code sizes of every step in `cost_report`.
     """
 
     __DEPLOYER_ACCOUNT: AccountAPI = None
@@ -537,13 +887,24 @@ class Deployer(Transactor):
         verify: bool,
         account: typing.Optional[AccountAPI] = None,
         autosign: bool = False,
+        dry_run: bool = False,
     ):
         super().__init__(account, autosign)
 
+        if dry_run and not is_local_network():
+            raise ValueError("Dry runs must be executed on a local network.")
         check_plugins()
         self.path = path
         self.config = config
-        self.registry_filepath = validate_config(config=self.config)
+        self.dry_run = dry_run
+        self.registry_filepath = validate_config(config=self.config, dry_run=dry_run)
+        if dry_run:
+            # nothing to resume: the local chain does not outlive the run
+            self._journal = DeploymentJournal(filepath=None)
+            self.cost_report = DeploymentCostReport()
+            verify = False
+        else:
+            self._journal = DeploymentJournal.for_registry(self.registry_filepath)
         self.constructor_parameters = ConstructorParameters.from_config(self.config)
         self.proxy_parameters = ProxyParameters.from_config(self.config)
 
@@ -555,6 +916,11 @@ class Deployer(Transactor):
         self._set_account(self._account)
         self.verify = verify
         self._print_deployment_info()
+        if len(self._journal):
+            print(
+                f"Resuming deployment from journal at {self._journal.filepath} "
+                f"({len(self._journal)} completed steps)."
+            )
 
         if not self._autosign:
             # Confirms the start of the deployment.
@@ -579,6 +945,140 @@ class Deployer(Transactor):
         """Returns the deployment kwargs."""
         return {"publish": self.verify}
 
+    def get_deployment_plan(self) -> DeploymentPlan:
+        """Returns the deployment plan of the contracts in the deployment config."""
+        return DeploymentPlan.from_parameters(self.constructor_parameters, self.proxy_parameters)
+
+    def deploy_all(self, pipelined: bool = False) -> typing.Dict[str, ContractInstance]:
+        """
+        Deploys all contracts of the deployment config following the deployment plan.
+        Any transactions to configure the deployed contracts are left to the caller.
+
+        If `pipelined` is True, the deployments of each stage of the plan are broadcast
+        back-to-back with locally assigned nonces and their receipts are awaited
+        concurrently; a stage only starts once all receipts of the previous one are in.
+        """
+        plan = self.get_deployment_plan()
+        print(f"\nDeployment plan:\n{plan}")
+        if not self._autosign:
+            _continue()
+
+        deployments = OrderedDict()
+        if pipelined and isinstance(self.get_account(), ImpersonatedAccount):
+            print("WARNING: Impersonated accounts cannot sign; deploying sequentially.")
+            pipelined = False
+        if not pipelined:
+            for contract_name in plan.order:
+                container = get_contract_container(contract_name)
+                deployments[contract_name] = self.deploy(container)
+            return deployments
+
+        for stage in plan.stages:
+            containers = [get_contract_container(contract_name) for contract_name in stage]
+            resolved_params = [self.constructor_parameters.resolve(name) for name in stage]
+            instances = self._deploy_pipelined(list(zip(containers, resolved_params)))
+            deployments.update(zip(stage, instances))
+
+            # proxies reference their (now deployed) implementations
+            proxied_names = [n for n in stage if self.proxy_parameters.contract_needs_proxy(n)]
+            if not proxied_names:
+                continue
+            proxy_container = deployment.constants.OZ_DEPENDENCY.TransparentUpgradeableProxy
+            proxy_infos = [self.proxy_parameters.resolve(name) for name in proxied_names]
+            proxy_deployments = [(proxy_container, params) for _, params in proxy_infos]
+            proxy_contracts = self._deploy_pipelined(proxy_deployments)
+            for name, (container, params), proxy_contract in zip(
+                proxied_names, proxy_infos, proxy_contracts
+            ):
+                deployments[name] = self._wrap_proxy(name, container, params, proxy_contract)
+        return deployments
+
+    def _deploy_pipelined(
+        self, deployments: List[typing.Tuple[ContractContainer, OrderedDict]]
+    ) -> List[ContractInstance]:
+        """
+        Broadcasts the (independent) deployments with consecutive, locally assigned nonces
+        without waiting in between, then awaits all receipts concurrently.
+        """
+        instances = dict()
+        steps = list()
+        for i, (container, resolved_params) in enumerate(deployments):
+            step = self._next_deployment_step(container, resolved_params)
+            steps.append(step)
+            instance = self._restore_deployment(container, step)
+            if instance is not None:
+                instances[i] = instance
+        pending = [i for i in range(len(deployments)) if i not in instances]
+        if not pending:
+            return [instances[i] for i in range(len(deployments))]
+
+        nonce = self.get_account().nonce
+        txn_hashes = list()
+        for i in pending:
+            container, resolved_params = deployments[i]
+            txn_hash = self._broadcast_deployment(container, resolved_params, nonce=nonce)
+            txn_hashes.append(txn_hash)
+            nonce += 1
+
+        for i, receipt in zip(pending, self._await_receipts(txn_hashes)):
+            container, _ = deployments[i]
+            receipt.raise_for_status()
+            instance = chain.contracts.instance_from_receipt(receipt, container.contract_type)
+            chain.contracts.cache_deployment(instance)
+            self._journal.record(steps[i], instance.address, receipt.txn_hash)
+            self._record_deployment_cost(container, instance, receipt)
+            print(f"{container.contract_type.name} deployed to: {instance.address}")
+            if self.verify:
+                project.deployments.track(instance)
+                networks.provider.network.publish_contract(instance.address)
+            instances[i] = instance
+        return [instances[i] for i in range(len(deployments))]
+
+    def _next_deployment_step(
+        self, container: ContractContainer, resolved_params: OrderedDict
+    ) -> str:
+        """Returns the journal step of the next deployment of a contract with the given params."""
+        return self._journal.next_step(
+            DeploymentJournal.DEPLOY,
+            container.contract_type.name,
+            container.contract_type.deployment_bytecode.bytecode,
+            list(resolved_params.values()),
+        )
+
+    def _restore_deployment(
+        self, container: ContractContainer, step: str
+    ) -> typing.Optional[ContractInstance]:
+        """Returns the contract deployed by a journaled step, if any."""
+        entry = self._journal.get(step)
+        if entry is None:
+            return None
+        print(
+            f"\nSkipping deployment of {container.contract_type.name}: deployed at "
+            f"{entry.address} in {entry.tx_hash} according to the deployment journal."
+        )
+        instance = container.at(entry.address, txn_hash=entry.tx_hash)
+        chain.contracts.cache_deployment(instance)
+        return instance
+
+    def _broadcast_deployment(
+        self, container: ContractContainer, resolved_params: OrderedDict, nonce: int
+    ) -> str:
+        """Signs and broadcasts a deployment transaction without waiting for its receipt."""
+        contract_name = container.contract_type.name
+        if not self._autosign:
+            _confirm_resolution(resolved_params, contract_name)
+
+        deployer_account = self.get_account()
+        txn = container(*resolved_params.values(), sender=deployer_account.address, nonce=nonce)
+        txn = deployer_account.prepare_transaction(txn)
+        signed_txn = deployer_account.sign_transaction(txn)
+        if not signed_txn:
+            raise ValueError(f"Deployment transaction of {contract_name} was not signed.")
+
+        txn_hash = self._send_signed_transaction(signed_txn)
+        print(f"\nBroadcast deployment of {contract_name} (nonce {nonce}): {txn_hash}")
+        return txn_hash
+
     def deploy(self, container: ContractContainer) -> ContractInstance:
         contract_name = container.contract_type.name
 
@@ -599,19 +1099,46 @@ class Deployer(Transactor):
         self, container: ContractContainer, resolved_params: OrderedDict
     ) -> ContractInstance:
         contract_name = container.contract_type.name
+        step = self._next_deployment_step(container, resolved_params)
+        instance = self._restore_deployment(container, step)
+        if instance is not None:
+            return instance
+
         if not self._autosign:
             _confirm_resolution(resolved_params, contract_name)
         deployment_params = [container, *resolved_params.values()]
         kwargs = self._get_kwargs()
 
         deployer_account = self.get_account()
-        return deployer_account.deploy(
+        instance = deployer_account.deploy(
             *deployment_params,
             # FIXME: Manual gas fees - #199
             #    max_priority_fee="3 gwei",
             #    max_fee="120 gwei",
             **kwargs,
         )
+        self._journal.record(step, instance.address, instance.txn_hash)
+        if self.cost_report is not None:
+            self._record_deployment_cost(
+                container, instance, chain.provider.get_receipt(instance.txn_hash)
+            )
+        return instance
+
+    def _record_deployment_cost(
+        self, container: ContractContainer, instance: ContractInstance, receipt: ReceiptAPI
+    ) -> None:
+        if self.cost_report is None:
+            return
+        self.cost_report.record(
+            CostReportStep(
+                kind="deploy",
+                name=container.contract_type.name,
+                address=instance.address,
+                gas_used=receipt.gas_used,
+                code_size=len(chain.provider.get_code(instance.address)),
+                initcode_size=len(container.contract_type.get_deployment_bytecode()),
+            )
+        )
 
     def _deploy_proxy(
         self,
@@ -619,7 +1146,7 @@ class Deployer(Transactor):
         contract_type_container: ContractContainer,
         resolved_proxy_params: OrderedDict,
     ) -> ContractInstance:
-        proxy_container = OZ_DEPENDENCY.TransparentUpgradeableProxy
+        proxy_container = deployment.constants.OZ_DEPENDENCY.TransparentUpgradeableProxy
         print(
             f"\nDeploying {proxy_container.contract_type.name} "
             f"contract to proxy {target_contract_name}."
@@ -627,6 +1154,23 @@ class Deployer(Transactor):
         proxy_contract = self._deploy_contract(
             proxy_container, resolved_params=resolved_proxy_params
         )
+        return self._wrap_proxy(
+            target_contract_name, contract_type_container, resolved_proxy_params, proxy_contract
+        )
+
+    def _wrap_proxy(
+        self,
+        target_contract_name: str,
+        contract_type_container: ContractContainer,
+        resolved_proxy_params: OrderedDict,
+        proxy_contract: ContractInstance,
+    ) -> ContractInstance:
+        _index_proxy(proxy_contract.address, resolved_proxy_params["_logic"])
+        if self.cost_report is not None:
+            self.cost_report.label(
+                proxy_contract.address,
+                f"{proxy_contract.contract_type.name} ({target_contract_name})",
+            )
         print(
             f"\nWrapping {target_contract_name} into {proxy_contract.contract_type.name} "
             f"(as type {contract_type_container.contract_type.name}) "
@@ -651,10 +1195,12 @@ class Deployer(Transactor):
             )
 
         admin_address = to_checksum_address(admin_slot[-20:])
-        proxy_admin = OZ_DEPENDENCY.ProxyAdmin.at(admin_address)
+        proxy_admin = deployment.constants.OZ_DEPENDENCY.ProxyAdmin.at(admin_address)
         # TODO: Check that owner of proxy admin is deployer
 
         self.transact(proxy_admin.upgradeAndCall, proxy_address, implementation.address, data)
+        invalidate_proxy_info(proxy_address)
+        _index_proxy(proxy_address, implementation.address)
 
         wrapped_instance = getattr(project, implementation.contract_type.name).at(proxy_address)
         return wrapped_instance
@@ -662,11 +1208,17 @@ class Deployer(Transactor):
     def finalize(self, deployments: List[ContractInstance]) -> None:
         """
         Publishes the deployments to the registry and optionally to block explorers.
+        Dry runs are not published.
         """
+        if self.dry_run:
+            print("\nDry run: the deployment is not published.")
+            return
         registry_from_ape_deployments(
             deployments=deployments,
             output_filepath=self.registry_filepath,
         )
+        # the deployment is published, there is nothing left to resume
+        self._journal.remove()
         if self.verify:
             verify_contracts(contracts=deployments)
 
@@ -676,6 +1228,7 @@ class Deployer(Transactor):
             f"Config: {self.path}",
             f"Registry: {self.registry_filepath}",
             f"Verify: {self.verify}",
+            f"Dry run: {self.dry_run}",
             f"Ecosystem: {networks.provider.network.ecosystem.name}",
             f"Network: {networks.provider.network.name}",
             f"Chain ID: {networks.provider.network.chain_id}",
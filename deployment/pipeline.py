@@ -0,0 +1,180 @@
+import asyncio
+import time
+import typing
+from typing import AsyncIterator, List, Tuple
+
+from ape import chain
+from ape.api import ImpersonatedAccount, ReceiptAPI, TransactionAPI
+from web3.exceptions import TransactionNotFound
+
+from deployment.params import BatchCall, Transactor
+
+# Minimum replacement fee increase accepted by geth-like nodes is 10%
+DEFAULT_FEE_BUMP = 1.125
+
+
+class PendingTransaction:
+    """A broadcast transaction and the replacements (fee bumps) sent for its nonce."""
+
+    def __init__(self, call: BatchCall, step: typing.Optional[str], txn: TransactionAPI):
+        self.call = call
+        self.step = step
+        self.txn = txn  # unsigned, prepared transaction of the latest replacement
+        self.txn_hashes: List[str] = list()
+        self.broadcast_at = 0.0
+
+    @property
+    def nonce(self) -> int:
+        return self.txn.nonce
+
+    @property
+    def bumps(self) -> int:
+        return len(self.txn_hashes) - 1
+
+
+class TransactionPipeline:
+    """
+    Submits the transactions of a `Transactor` without waiting for each receipt:
+    transactions are signed and broadcast with locally assigned nonces, pending ones are
+    tracked concurrently (replacing those stuck for longer than `stuck_timeout` seconds
+    by fee bumped ones), and receipts are yielded as they confirm.
+
+    At most `max_pending` transactions are in flight at once, as nodes limit the number
+    of pending transactions per account. As with batches, calls are prepared before the
+    ones ahead of them are mined, so dependent calls belong in separate pipeline runs.
+    """
+
+    def __init__(
+        self,
+        transactor: Transactor,
+        max_pending: int = 16,
+        stuck_timeout: float = 120,
+        fee_bump: float = DEFAULT_FEE_BUMP,
+        max_bumps: int = 3,
+        poll_interval: float = 2,
+    ):
+        account = transactor.get_account()
+        if isinstance(account, ImpersonatedAccount):
+            raise ValueError("Impersonated accounts cannot sign; use Transactor.transact_batch.")
+        self._transactor = transactor
+        self._account = account
+        self.max_pending = max_pending
+        self.stuck_timeout = stuck_timeout
+        self.fee_bump = fee_bump
+        self.max_bumps = max_bumps
+        self.poll_interval = poll_interval
+
+    def run(self, calls: List[BatchCall]) -> List[ReceiptAPI]:
+        """Submits the calls and returns their receipts, in call order, once all confirmed."""
+
+        async def _collect() -> None:
+            async for _ in self.stream(calls):
+                pass
+
+        asyncio.run(_collect())
+        return [call.receipt for call in calls]
+
+    async def stream(self, calls: List[BatchCall]) -> AsyncIterator[Tuple[BatchCall, ReceiptAPI]]:
+        """
+        Submits the calls (after a single confirmation) and yields each call with its receipt
+        as soon as it confirms, i.e. not necessarily in call order. Calls completed according
+        to the transactor's journal are yielded first.
+        """
+        transactor = self._transactor
+        steps = [transactor._next_transaction_step(call) for call in calls]
+        pending = list()
+        for call, step in zip(calls, steps):
+            receipt = transactor._restore_transaction(call, step)
+            if receipt is None:
+                pending.append((call, step))
+                continue
+            call.receipt = receipt
+            yield call, receipt
+        if not pending:
+            return
+
+        transactor._confirm_calls([call for call, _ in pending])
+        slots = asyncio.Semaphore(self.max_pending)
+        nonce = await asyncio.to_thread(lambda: self._account.nonce)
+        tasks = list()
+        for call, step in pending:
+            await slots.acquire()
+            txn = await asyncio.to_thread(self._prepare, call, nonce)
+            transaction = PendingTransaction(call=call, step=step, txn=txn)
+            await asyncio.to_thread(self._broadcast, transaction)
+            tasks.append(asyncio.create_task(self._track(transaction, slots)))
+            nonce += 1
+
+        for task in asyncio.as_completed(tasks):
+            transaction, receipt = await task
+            yield transaction.call, receipt
+
+    def _prepare(self, call: BatchCall, nonce: int) -> TransactionAPI:
+        return call.method.as_transaction(*call.args, sender=self._account, nonce=nonce)
+
+    def _broadcast(self, transaction: PendingTransaction) -> None:
+        signed_txn = self._account.sign_transaction(transaction.txn.model_copy(deep=True))
+        if not signed_txn:
+            raise ValueError(f"Transaction {transaction.call.method} was not signed.")
+        txn_hash = self._transactor._send_signed_transaction(signed_txn)
+        transaction.txn_hashes.append(txn_hash)
+        transaction.broadcast_at = time.monotonic()
+        action = "Broadcast" if not transaction.bumps else f"Replaced (bump {transaction.bumps})"
+        print(f"{action} {transaction.call.method} (nonce {transaction.nonce}): {txn_hash}")
+
+    def _bump_fees(self, transaction: PendingTransaction) -> None:
+        txn = transaction.txn
+        if txn.max_fee is not None:
+            update = {
+                "max_fee": int(txn.max_fee * self.fee_bump),
+                "max_priority_fee": int(txn.max_priority_fee * self.fee_bump),
+            }
+        else:
+            update = {"gas_price": int(txn.gas_price * self.fee_bump)}
+        transaction.txn = txn.model_copy(update=update)
+        try:
+            self._broadcast(transaction)
+        except Exception:
+            transaction.txn = txn
+            raise
+
+    def _find_receipt(self, transaction: PendingTransaction) -> typing.Optional[str]:
+        """Returns the hash of whichever of the (replacement) transactions was mined, if any."""
+        for txn_hash in reversed(transaction.txn_hashes):
+            try:
+                chain.provider.web3.eth.get_transaction_receipt(txn_hash)
+            except TransactionNotFound:
+                continue
+            return txn_hash
+        return None
+
+    async def _track(
+        self, transaction: PendingTransaction, slots: asyncio.Semaphore
+    ) -> Tuple[PendingTransaction, ReceiptAPI]:
+        try:
+            while True:
+                txn_hash = await asyncio.to_thread(self._find_receipt, transaction)
+                if txn_hash is not None:
+                    break
+                stuck = time.monotonic() - transaction.broadcast_at > self.stuck_timeout
+                if stuck and transaction.bumps < self.max_bumps:
+                    try:
+                        await asyncio.to_thread(self._bump_fees, transaction)
+                    except Exception as e:
+                        # e.g. the nonce was taken by one of the transactions sent before;
+                        # the error type depends on the provider, so any failure is tolerated
+                        print(f"WARNING: Could not replace {transaction.txn_hashes[-1]}: {e}")
+                        transaction.broadcast_at = time.monotonic()
+                await asyncio.sleep(self.poll_interval)
+        finally:
+            slots.release()
+
+        required_confirmations = chain.provider.network.required_confirmations
+        receipt = await asyncio.to_thread(
+            chain.provider.get_receipt, txn_hash, required_confirmations=required_confirmations
+        )
+        if receipt.failed:
+            transaction.call.receipt = receipt
+        else:
+            self._transactor._record_transaction(transaction.call, transaction.step, receipt)
+        return transaction, receipt
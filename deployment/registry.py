@@ -1,17 +1,46 @@
+import hashlib
 import json
-import shutil
+import os
+import stat
+import tempfile
 from collections import OrderedDict, defaultdict
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, NamedTuple, Optional
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
 
-from ape import networks, project
-from ape.contracts import ContractInstance
-from eth_typing import ChecksumAddress
+import ape
+import ijson
+import msgspec
+from eth_typing import ABI, ChecksumAddress
 from eth_utils import to_checksum_address
-from web3.types import ABI
+from hexbytes import HexBytes
 
-from deployment.utils import _load_json, get_contract_container, registry_filepath_from_domain
+from deployment.abi import AbiSelectors, abi_fingerprint, abi_selectors, sort_abi
+from deployment.constants import EIP1967_ADMIN_SLOT, EIP1967_IMPLEMENTATION_SLOT
+from deployment.utils import (
+    _load_json,
+    batch_rpc_requests,
+    get_contract_container,
+    registry_filepath_from_domain,
+)
+
+if TYPE_CHECKING:
+    # ape's contract machinery is loaded on first use, not on import
+    from ape.contracts import ContractInstance
+    from ethpm_types import ContractType
 
 ChainId = int
 ContractName = str
@@ -19,6 +48,12 @@ ContractName = str
 
 STANDARD_REGISTRY_JSON_FORMAT = {"indent": 4, "separators": (",", ": ")}
 
+# Top-level key of the deduplicated ABI section in compact registries
+COMPACT_REGISTRY_ABIS_KEY = "abis"
+
+# Optional per-entry key holding the precomputed function/error selectors and event topics
+REGISTRY_SELECTORS_KEY = "selectors"
+
 
 class NoContractFound(Exception):
     """Raised when a contract is not found in the registry."""
@@ -36,37 +71,73 @@ class RegistryEntry(NamedTuple):
     deployer: str
 
 
-def _get_abi(contract_instance: ContractInstance) -> ABI:
-    """Returns the ABI of a contract instance."""
-    contract_abi = list()
+class EIP1967ProxyInfo(NamedTuple):
+    implementation: ChecksumAddress
+    admin: ChecksumAddress
+
+
+# Per-process cache of address -> EIP-1967 proxy slots (None if the address is not a proxy)
+_PROXY_INFOS: Dict[ChecksumAddress, Optional[EIP1967ProxyInfo]] = dict()
+
+
+def get_proxy_infos(addresses: List[ChecksumAddress]) -> Dict[ChecksumAddress, EIP1967ProxyInfo]:
+    """
+    Returns the EIP-1967 proxy information of those addresses that are proxies.
+    Implementation and admin slots of all uncached addresses are read in one batch request.
+    """
+    addresses = [to_checksum_address(address) for address in addresses]
+    uncached_addresses = [a for a in dict.fromkeys(addresses) if a not in _PROXY_INFOS]
+
+    calls = list()
+    for address in uncached_addresses:
+        for slot in (EIP1967_IMPLEMENTATION_SLOT, EIP1967_ADMIN_SLOT):
+            calls.append(("eth_getStorageAt", [address, hex(slot), "latest"]))
+    results = batch_rpc_requests(calls)
+
+    for index, address in enumerate(uncached_addresses):
+        implementation_slot = HexBytes(results[2 * index])
+        admin_slot = HexBytes(results[2 * index + 1])
+        if not any(implementation_slot):
+            _PROXY_INFOS[address] = None
+            continue
+        _PROXY_INFOS[address] = EIP1967ProxyInfo(
+            implementation=to_checksum_address(implementation_slot[-20:]),
+            admin=to_checksum_address(admin_slot[-20:]),
+        )
+
+    return {a: _PROXY_INFOS[a] for a in addresses if _PROXY_INFOS[a] is not None}
+
+
+def invalidate_proxy_info(address: ChecksumAddress) -> None:
+    """Drops cached proxy information e.g. after the proxy was upgraded."""
+    _PROXY_INFOS.pop(to_checksum_address(address), None)
+
 
-    # check if proxy contract, use underlying implementation contract ABI
-    proxy_info = networks.provider.network.ecosystem.get_proxy_info(contract_instance.address)
-    # proxy_info = chain_fixture.contracts.get_proxy_info(contract_instance.address)
-    if proxy_info:
+def _get_contract_type(contract_instance: "ContractInstance", is_proxy: bool) -> "ContractType":
+    """Returns the contract type of a contract instance, or of its implementation if proxied."""
+    if is_proxy:
+        # use underlying implementation contract type
         contract_container = get_contract_container(contract_instance.contract_type.name)
-        contract_instance = contract_container.at(proxy_info.target)
+        return contract_container.contract_type
+    return contract_instance.contract_type
 
-    for entry in contract_instance.contract_type.abi:
+
+def _get_abi(contract_type: "ContractType") -> ABI:
+    """Returns the ABI of a contract type."""
+    contract_abi = list()
+    for entry in contract_type.abi:
         contract_abi.append(entry.model_dump())
     return contract_abi
 
 
 def _get_name(
-    contract_instance: ContractInstance, registry_names: Dict[ContractName, ContractName]
+    contract_type: "ContractType", registry_names: Dict[ContractName, ContractName]
 ) -> ContractName:
     """
-    Returns the optionally remapped registry name of a contract instance.
-    If the contract instance is not remapped, the real contract name is returned.
+    Returns the optionally remapped registry name of a contract type.
+    If the contract type is not remapped, the real contract name is returned.
     """
-    # check if proxy contract, use underlying implementation contract ABI
-    proxy_info = networks.provider.network.ecosystem.get_proxy_info(contract_instance.address)
-    # proxy_info = chain_fixture.contracts.get_proxy_info(contract_instance.address)
-    if proxy_info:
-        contract_container = get_contract_container(contract_instance.contract_type.name)
-        contract_instance = contract_container.at(proxy_info.target)
-
-    real_contract_name = contract_instance.contract_type.name
+    real_contract_name = contract_type.name
     contract_name = registry_names.get(
         real_contract_name,  # look up name in registry_names
         real_contract_name,  # default to the real contract name
@@ -75,10 +146,13 @@ def _get_name(
 
 
 def _get_entry(
-    contract_instance: ContractInstance, registry_names: Dict[ContractName, ContractName]
+    contract_instance: "ContractInstance",
+    registry_names: Dict[ContractName, ContractName],
+    is_proxy: bool,
 ) -> RegistryEntry:
-    contract_abi = _get_abi(contract_instance)
-    contract_name = _get_name(contract_instance=contract_instance, registry_names=registry_names)
+    contract_type = _get_contract_type(contract_instance=contract_instance, is_proxy=is_proxy)
+    contract_abi = _get_abi(contract_type)
+    contract_name = _get_name(contract_type=contract_type, registry_names=registry_names)
     receipt = contract_instance.creation_metadata.receipt
     entry = RegistryEntry(
         name=contract_name,
@@ -93,84 +167,663 @@ def _get_entry(
 
 
 def _get_entries(
-    contract_instances: List[ContractInstance], registry_names: Dict[ContractName, ContractName]
+    contract_instances: List["ContractInstance"], registry_names: Dict[ContractName, ContractName]
 ) -> List[RegistryEntry]:
     """Returns a list of contract entries from a list of contract instances."""
+    proxy_infos = get_proxy_infos([instance.address for instance in contract_instances])
     entries = list()
     for contract_instance in contract_instances:
-        entry = _get_entry(contract_instance=contract_instance, registry_names=registry_names)
+        entry = _get_entry(
+            contract_instance=contract_instance,
+            registry_names=registry_names,
+            is_proxy=to_checksum_address(contract_instance.address) in proxy_infos,
+        )
         entries.append(entry)
     return entries
 
 
-def read_registry(filepath: Path) -> List[RegistryEntry]:
-    with open(filepath, "r") as file:
-        data = json.load(file)
+def _entry_from_artifacts(chain_id: ChainId, name: ContractName, artifacts: Dict) -> RegistryEntry:
+    return RegistryEntry(
+        chain_id=chain_id,
+        name=name,
+        address=artifacts["address"],
+        abi=artifacts["abi"],
+        tx_hash=artifacts["tx_hash"],
+        block_number=artifacts["block_number"],
+        deployer=artifacts["deployer"],
+    )
+
+
+def _parse_registry_data(data: Dict[str, Any]) -> List[RegistryEntry]:
+    """Returns the entries of a decoded nucypher-style contract registry document."""
+    # compact registries reference deduplicated ABIs by their fingerprint
+    abis = data.get(COMPACT_REGISTRY_ABIS_KEY, dict())
     registry_entries = list()
     for chain_id, entries in data.items():
+        if chain_id == COMPACT_REGISTRY_ABIS_KEY:
+            continue
         for contract_name, artifacts in entries.items():
-            registry_entry = RegistryEntry(
-                chain_id=int(chain_id),
-                name=contract_name,
-                address=artifacts["address"],
-                abi=artifacts["abi"],
-                tx_hash=artifacts["tx_hash"],
-                block_number=artifacts["block_number"],
-                deployer=artifacts["deployer"],
-            )
+            if isinstance(artifacts["abi"], str):
+                artifacts = dict(artifacts, abi=abis[artifacts["abi"]])
+            registry_entry = _entry_from_artifacts(int(chain_id), contract_name, artifacts)
             registry_entries.append(registry_entry)
     return registry_entries
 
 
-def write_registry(entries: List[RegistryEntry], filepath: Path, silent: bool = False) -> Path:
-    """Writes a nucypher-style contract registry to a file."""
+def _parse_registry_selectors(
+    data: Dict[str, Any],
+) -> Dict[Tuple[ChainId, ContractName], AbiSelectors]:
+    """Returns the selector and topic tables embedded in a decoded registry document."""
+    selectors = dict()
+    for chain_id, entries in data.items():
+        if chain_id == COMPACT_REGISTRY_ABIS_KEY:
+            continue
+        for contract_name, artifacts in entries.items():
+            tables = artifacts.get(REGISTRY_SELECTORS_KEY)
+            if tables is not None:
+                selectors[(int(chain_id), contract_name)] = AbiSelectors(**tables)
+    return selectors
 
-    if not entries:
-        print("No entries provided.")
-        return filepath
 
-    # Sort registry entries to enforce common order
-    # See https://github.com/nucypher/nucypher-contracts/issues/192
-    entries.sort(key=lambda entry: (str(entry.chain_id), entry.name))
+def _parse_registry(filepath: Path) -> List[RegistryEntry]:
+    """Parses all entries of a nucypher-style contract registry file."""
+    return _parse_registry_data(_load_json(filepath))
 
-    data = defaultdict(dict)
-    for entry in entries:
-        entry_abi = list(entry.abi)
-        entry_abi.sort(key=lambda d: (d["type"], d.get("name", "")))
 
-        data[str(entry.chain_id)][entry.name] = {
+class RegistrySnapshot(msgspec.Struct, array_like=True):
+    """
+    Binary (msgpack) snapshot of a registry file with deduplicated, already decoded ABIs
+    and the name and address indexes of the registry, so that loading it needs neither
+    JSON parsing nor address checksumming.
+    Each entry is (chain_id, name, address, abi index, tx_hash, block_number, deployer).
+    """
+
+    version: int
+    source_digest: str  # SHA-256 of the registry file the snapshot was compiled from
+    abis: List[List[Dict[str, Any]]]
+    entries: List[Tuple[int, str, str, int, str, int, str]]
+    names: Dict[int, Dict[str, int]]  # chain id -> contract name -> entry index
+    addresses: Dict[str, List[int]]  # checksum address -> entry indices
+    selectors: Dict[int, AbiSelectors]  # entry index -> embedded selector and topic tables
+
+
+REGISTRY_SNAPSHOT_VERSION = 3
+REGISTRY_SNAPSHOT_SUFFIX = ".msgpack"
+
+_snapshot_decoder = msgspec.msgpack.Decoder(RegistrySnapshot)
+
+
+def registry_snapshot_filepath(filepath: Path) -> Path:
+    """Returns the filepath of the binary snapshot of a registry file."""
+    return filepath.with_suffix(REGISTRY_SNAPSHOT_SUFFIX)
+
+
+def _load_registry_snapshot(
+    snapshot_filepath: Path, source_digest: str
+) -> Optional[RegistrySnapshot]:
+    """
+    Returns the snapshot if it was compiled from a registry file with the given digest,
+    or None if it is missing, stale or was written by an incompatible version.
+    """
+    try:
+        snapshot = _snapshot_decoder.decode(snapshot_filepath.read_bytes())
+    except (FileNotFoundError, msgspec.DecodeError):
+        return None
+    if snapshot.version != REGISTRY_SNAPSHOT_VERSION or snapshot.source_digest != source_digest:
+        return None
+    return snapshot
+
+
+def _entries_from_snapshot(snapshot: RegistrySnapshot) -> List[RegistryEntry]:
+    registry_entries = list()
+    for chain_id, name, address, abi_index, tx_hash, block_number, deployer in snapshot.entries:
+        registry_entry = RegistryEntry(
+            chain_id=chain_id,
+            name=name,
+            address=address,
+            abi=snapshot.abis[abi_index],
+            tx_hash=tx_hash,
+            block_number=block_number,
+            deployer=deployer,
+        )
+        registry_entries.append(registry_entry)
+    return registry_entries
+
+
+def build_registry_snapshot(filepath: Path) -> Path:
+    """Compiles a registry file into a binary snapshot that is faster to load."""
+    registry_data = Path(filepath).read_bytes()
+    snapshot = RegistrySnapshot(
+        version=REGISTRY_SNAPSHOT_VERSION,
+        source_digest=hashlib.sha256(registry_data).hexdigest(),
+        abis=list(),
+        entries=list(),
+        names=defaultdict(dict),
+        addresses=defaultdict(list),
+        selectors=dict(),
+    )
+    data = json.loads(registry_data)
+    embedded_selectors = _parse_registry_selectors(data)
+    abi_indices: Dict[str, int] = dict()
+    for index, entry in enumerate(_parse_registry_data(data)):
+        abi_hash = abi_fingerprint(entry.abi)
+        if abi_hash not in abi_indices:
+            abi_indices[abi_hash] = len(snapshot.abis)
+            snapshot.abis.append(list(entry.abi))
+        snapshot.entries.append(
+            (
+                entry.chain_id,
+                entry.name,
+                entry.address,
+                abi_indices[abi_hash],
+                entry.tx_hash,
+                int(entry.block_number),
+                entry.deployer,
+            )
+        )
+        snapshot.names[entry.chain_id][entry.name] = index
+        snapshot.addresses[to_checksum_address(entry.address)].append(index)
+        if (entry.chain_id, entry.name) in embedded_selectors:
+            snapshot.selectors[index] = embedded_selectors[(entry.chain_id, entry.name)]
+
+    snapshot_filepath = registry_snapshot_filepath(filepath)
+    _write_atomically(snapshot_filepath, msgspec.msgpack.encode(snapshot))
+    return snapshot_filepath
+
+
+class SelectorMatch(NamedTuple):
+    """A function, error or event of a registry contract matching a selector or topic."""
+
+    name: ContractName
+    address: ChecksumAddress
+    kind: str  # "function", "error" or "event"
+    signature: str
+
+
+class Registry:
+    """
+    Indexed, in-process view of a nucypher-style contract registry.
+
+    Use `Registry.from_file` to get an instance: each registry file is parsed once
+    per process and re-parsed only when its modification time or size changes.
+    A binary snapshot of the registry (see `build_registry_snapshot`) is used instead
+    of the JSON file whenever it was compiled from the current contents of the file.
+    """
+
+    _cache: Dict[Path, Tuple[Tuple[int, int], "Registry"]] = dict()
+
+    def __init__(
+        self,
+        entries: List[RegistryEntry],
+        by_name: Optional[Dict[Tuple[ChainId, ContractName], RegistryEntry]] = None,
+        by_address: Optional[Dict[ChecksumAddress, List[RegistryEntry]]] = None,
+        selectors: Optional[Dict[Tuple[ChainId, ContractName], AbiSelectors]] = None,
+    ):
+        self.entries = tuple(entries)
+        # selector and topic tables embedded in the registry file, computed when missing
+        self._selectors = selectors or dict()
+        self._by_name: Dict[Tuple[ChainId, ContractName], RegistryEntry] = by_name or dict()
+        self._by_address: Dict[ChecksumAddress, List[RegistryEntry]] = by_address or dict()
+        self._by_chain: Dict[ChainId, List[RegistryEntry]] = defaultdict(list)
+        self._instances: Dict[Tuple[ChainId, ContractName], "ContractInstance"] = dict()
+        self._selector_indexes: Dict[ChainId, Dict[str, List[SelectorMatch]]] = dict()
+        self._topic_indexes: Dict[ChainId, Dict[str, List[SelectorMatch]]] = dict()
+        for entry in self.entries:
+            self._by_chain[entry.chain_id].append(entry)
+        if by_name is None:
+            for entry in self.entries:
+                self._by_name[(entry.chain_id, entry.name)] = entry
+        if by_address is None:
+            for entry in self.entries:
+                address = to_checksum_address(entry.address)
+                self._by_address.setdefault(address, list()).append(entry)
+
+    @classmethod
+    def _from_snapshot(cls, snapshot: RegistrySnapshot) -> "Registry":
+        """Returns the registry of a snapshot, using its persisted indexes."""
+        entries = _entries_from_snapshot(snapshot)
+        by_name = {
+            (chain_id, name): entries[index]
+            for chain_id, names in snapshot.names.items()
+            for name, index in names.items()
+        }
+        by_address = {
+            address: [entries[index] for index in indices]
+            for address, indices in snapshot.addresses.items()
+        }
+        selectors = {
+            (entries[index].chain_id, entries[index].name): tables
+            for index, tables in snapshot.selectors.items()
+        }
+        return cls(entries=entries, by_name=by_name, by_address=by_address, selectors=selectors)
+
+    @classmethod
+    def from_file(cls, filepath: Path) -> "Registry":
+        """Returns the (cached) registry for the given registry file."""
+        filepath = Path(filepath).resolve()
+        stat = filepath.stat()
+        cache_key = (stat.st_mtime_ns, stat.st_size)
+        cached = cls._cache.get(filepath)
+        if cached and cached[0] == cache_key:
+            return cached[1]
+
+        registry_data = filepath.read_bytes()
+        snapshot = _load_registry_snapshot(
+            registry_snapshot_filepath(filepath),
+            source_digest=hashlib.sha256(registry_data).hexdigest(),
+        )
+        if snapshot is not None:
+            registry = cls._from_snapshot(snapshot)
+        else:
+            data = json.loads(registry_data)
+            registry = cls(
+                entries=_parse_registry_data(data), selectors=_parse_registry_selectors(data)
+            )
+        cls._cache[filepath] = (cache_key, registry)
+        return registry
+
+    @property
+    def chain_ids(self) -> List[ChainId]:
+        return list(self._by_chain)
+
+    def chain_entries(self, chain_id: ChainId) -> List[RegistryEntry]:
+        """Returns the registry entries for the given chain."""
+        return list(self._by_chain.get(chain_id, []))
+
+    def get_entry(self, chain_id: ChainId, name: ContractName) -> RegistryEntry:
+        """Returns the registry entry for the contract name on the given chain."""
+        try:
+            return self._by_name[(chain_id, name)]
+        except KeyError:
+            raise NoContractFound(f"Contract '{name}' not found in registry for chain {chain_id}.")
+
+    def get_entries_by_address(self, address: ChecksumAddress) -> List[RegistryEntry]:
+        """Returns the registry entries (across all chains) deployed at the given address."""
+        return list(self._by_address.get(to_checksum_address(address), []))
+
+    def _build_selector_indexes(self, chain_id: ChainId) -> None:
+        selector_index = defaultdict(list)
+        topic_index = defaultdict(list)
+        for entry in self._by_chain.get(chain_id, []):
+            tables = self._selectors.get((chain_id, entry.name))
+            functions, events, errors = tables or _cached_abi_selectors(entry.abi)
+            for kind, table, index in (
+                ("function", functions, selector_index),
+                ("error", errors, selector_index),
+                ("event", events, topic_index),
+            ):
+                for selector, signature in table.items():
+                    match = SelectorMatch(entry.name, entry.address, kind, signature)
+                    index[selector].append(match)
+        self._selector_indexes[chain_id] = dict(selector_index)
+        self._topic_indexes[chain_id] = dict(topic_index)
+
+    def lookup_selector(self, chain_id: ChainId, selector: str) -> List[SelectorMatch]:
+        """
+        Returns the functions and errors of all contracts on the given chain
+        with the given 4-byte selector (hex string, e.g. taken from calldata).
+        """
+        if chain_id not in self._selector_indexes:
+            self._build_selector_indexes(chain_id)
+        return list(self._selector_indexes[chain_id].get(selector[:10].lower(), []))
+
+    def lookup_topic(self, chain_id: ChainId, topic: str) -> List[SelectorMatch]:
+        """Returns the events of all contracts on the given chain with the given topic0."""
+        if chain_id not in self._topic_indexes:
+            self._build_selector_indexes(chain_id)
+        return list(self._topic_indexes[chain_id].get(topic.lower(), []))
+
+    def get_contract(self, chain_id: ChainId, name: ContractName) -> "ContractInstance":
+        """Returns the (memoized) contract instance for the contract name on the given chain."""
+        key = (chain_id, name)
+        instance = self._instances.get(key)
+        if instance is None:
+            entry = self.get_entry(chain_id=chain_id, name=name)
+            contract_container = get_contract_container(entry.name)
+            instance = contract_container.at(entry.address)
+            self._instances[key] = instance
+        return instance
+
+
+def read_registry(filepath: Path) -> List[RegistryEntry]:
+    return list(Registry.from_file(filepath).entries)
+
+
+def _iter_raw_entries(
+    file: IO, chain_id: Optional[ChainId] = None, include_abi: bool = True
+) -> Iterator[Tuple[ChainId, ContractName, Dict]]:
+    """
+    Incrementally parses a registry file and yields (chain_id, name, artifacts) for each
+    entry, optionally restricted to a single chain and/or without the entry ABI.
+    Only the selected entries are ever materialized.
+    """
+    events = ijson.parse(file)
+    for prefix, event, value in events:
+        # registry entries are the maps found two levels deep i.e. at "<chain_id>.<name>"
+        if event != "start_map" or prefix.count(".") != 1:
+            continue
+        entry_prefix = prefix
+        entry_chain_id, name = entry_prefix.split(".")
+        if entry_chain_id == COMPACT_REGISTRY_ABIS_KEY:
+            continue
+        if chain_id is not None and int(entry_chain_id) != chain_id:
+            continue
+
+        abi_prefix = f"{entry_prefix}.abi"
+        builder = ijson.ObjectBuilder()
+        builder.event(event, value)
+        for prefix, event, value in events:
+            if not include_abi:
+                if prefix == entry_prefix and event == "map_key" and value == "abi":
+                    continue
+                if prefix == abi_prefix or prefix.startswith(f"{abi_prefix}."):
+                    continue
+            builder.event(event, value)
+            if prefix == entry_prefix and event == "end_map":
+                break
+        yield int(entry_chain_id), name, builder.value
+
+
+def iter_registry(filepath: Path, chain_id: Optional[ChainId] = None) -> Iterator[RegistryEntry]:
+    """
+    Streams the entries of a nucypher-style contract registry, optionally restricted
+    to a single chain, without loading the whole document into memory.
+    """
+    with open(filepath, "rb") as file:
+        if chain_id is not None:
+            # the chain section is located by the (native) parser without building the rest
+            chain_items = ijson.kvitems(file, str(chain_id))
+            raw_entries = ((chain_id, name, artifacts) for name, artifacts in chain_items)
+        else:
+            raw_entries = _iter_raw_entries(file)
+        # buffer entries referencing deduplicated ABIs which are resolved in a second pass
+        compact_entries = list()
+        for entry_chain_id, name, artifacts in raw_entries:
+            if isinstance(artifacts["abi"], str):
+                compact_entries.append((entry_chain_id, name, artifacts))
+                continue
+            yield _entry_from_artifacts(entry_chain_id, name, artifacts)
+
+        if not compact_entries:
+            return
+
+        file.seek(0)
+        abi_hashes = {artifacts["abi"] for _, _, artifacts in compact_entries}
+        abis = {
+            abi_hash: abi
+            for abi_hash, abi in ijson.kvitems(file, COMPACT_REGISTRY_ABIS_KEY)
+            if abi_hash in abi_hashes
+        }
+        for entry_chain_id, name, artifacts in compact_entries:
+            artifacts["abi"] = abis[artifacts["abi"]]
+            yield _entry_from_artifacts(entry_chain_id, name, artifacts)
+
+
+def iter_registry_addresses(
+    filepath: Path, chain_id: Optional[ChainId] = None
+) -> Iterator[Tuple[ChainId, ContractName, ChecksumAddress]]:
+    """
+    Streams (chain_id, name, address) for the entries of a nucypher-style contract
+    registry, optionally restricted to a single chain. ABIs are skipped entirely.
+    """
+    with open(filepath, "rb") as file:
+        raw_entries = _iter_raw_entries(file, chain_id=chain_id, include_abi=False)
+        for entry_chain_id, name, artifacts in raw_entries:
+            yield entry_chain_id, name, artifacts["address"]
+
+
+class _RegistryDocument(NamedTuple):
+    """A registry file, decoded once."""
+
+    filepath: Path
+    content: bytes
+    data: Dict[str, Any]
+    entries: List[RegistryEntry]
+
+    @property
+    def compact(self) -> bool:
+        return COMPACT_REGISTRY_ABIS_KEY in self.data
+
+    @property
+    def selectors(self) -> bool:
+        return any(
+            REGISTRY_SELECTORS_KEY in artifacts
+            for key, entries in self.data.items()
+            if key != COMPACT_REGISTRY_ABIS_KEY
+            for artifacts in entries.values()
+        )
+
+
+def _read_registry_document(filepath: Path) -> _RegistryDocument:
+    content = Path(filepath).read_bytes()
+    data = json.loads(content)
+    return _RegistryDocument(
+        filepath=Path(filepath),
+        content=content,
+        data=data,
+        entries=_parse_registry_data(data),
+    )
+
+
+def is_compact_registry(filepath: Path) -> bool:
+    """Returns True if the registry file uses the compact (deduplicated ABIs) format."""
+    return _read_registry_document(filepath).compact
+
+
+def has_registry_selectors(filepath: Path) -> bool:
+    """Returns True if the registry file entries embed their selector and topic tables."""
+    return _read_registry_document(filepath).selectors
+
+
+# Fingerprints of the ABIs seen by this process, keyed by identity (ABIs are not mutated
+# once loaded). Cleared when full, so that it does not keep every ABI alive.
+_ABI_FINGERPRINTS_CACHE_SIZE = 1024
+_ABI_FINGERPRINTS: Dict[int, Tuple[ABI, str]] = dict()
+_ABI_SELECTORS: Dict[str, AbiSelectors] = dict()
+
+
+def _cached_abi_selectors(abi: ABI) -> AbiSelectors:
+    fingerprint = _cached_abi_fingerprint(abi)
+    if fingerprint not in _ABI_SELECTORS:
+        _ABI_SELECTORS[fingerprint] = abi_selectors(abi)
+    return _ABI_SELECTORS[fingerprint]
+
+
+def _cached_abi_fingerprint(abi: ABI) -> str:
+    cached = _ABI_FINGERPRINTS.get(id(abi))
+    if cached and cached[0] is abi:
+        return cached[1]
+    fingerprint = abi_fingerprint(abi)
+    if len(_ABI_FINGERPRINTS) >= _ABI_FINGERPRINTS_CACHE_SIZE:
+        _ABI_FINGERPRINTS.clear()
+    _ABI_FINGERPRINTS[id(abi)] = (abi, fingerprint)
+    return fingerprint
+
+
+def _chain_section(entries: List[RegistryEntry], compact: bool, selectors: bool) -> Dict:
+    """Returns the registry section of the entries for a single chain."""
+    section = dict()
+    for entry in entries:
+        entry_abi = _cached_abi_fingerprint(entry.abi) if compact else sort_abi(entry.abi)
+        section[entry.name] = {
             "address": entry.address,
             "abi": entry_abi,
             "tx_hash": entry.tx_hash,
             "block_number": int(entry.block_number),
             "deployer": entry.deployer,
         }
+        if selectors:
+            section[entry.name][REGISTRY_SELECTORS_KEY] = _cached_abi_selectors(entry.abi)._asdict()
+    return section
+
+
+# Encodings of registry sections produced by this process, keyed by their compact encoding
+# (which is several times cheaper to produce); the least recently used are evicted
+_ENCODED_SECTIONS: "OrderedDict[str, str]" = OrderedDict()
+_ENCODED_SECTIONS_CACHE_SIZE = 32
+
+
+def _encode_section(section: Dict, reuse: bool = True) -> str:
+    """
+    Encodes a top-level registry section as it is nested in the registry document.
+    Unless `reuse` is False, the encoding of an identical section (including the order
+    of its keys) which was encoded before is reused.
+    """
+    cache_key = json.dumps(section, separators=(",", ":"))
+    if reuse and cache_key in _ENCODED_SECTIONS:
+        _ENCODED_SECTIONS.move_to_end(cache_key)
+        return _ENCODED_SECTIONS[cache_key]
+
+    encoded_section = json.dumps(section, **STANDARD_REGISTRY_JSON_FORMAT).replace("\n", "\n    ")
+    _ENCODED_SECTIONS[cache_key] = encoded_section
+    if len(_ENCODED_SECTIONS) > _ENCODED_SECTIONS_CACHE_SIZE:
+        _ENCODED_SECTIONS.popitem(last=False)
+    return encoded_section
+
+
+def _join_sections(sections: Iterable[Tuple[str, str]]) -> str:
+    body = ",\n".join(f"    {json.dumps(key)}: {section}" for key, section in sections)
+    return "{\n" + body + "\n}"
+
+
+def _encode_registry(
+    entries: List[RegistryEntry],
+    compact: bool,
+    selectors: bool,
+    reuse_sections: bool = True,
+) -> bytes:
+    """
+    Returns the registry document in either the verbose or the compact format,
+    optionally with the selector and topic tables of each entry. Unless `reuse_sections`
+    is False, sections which were encoded before (e.g. unchanged chains of a registry
+    written repeatedly) are not re-encoded.
+    """
+    chain_entries = defaultdict(list)
+    for entry in entries:
+        chain_entries[str(entry.chain_id)].append(entry)
+
+    sections = dict()
+    if compact:
+        abis = {_cached_abi_fingerprint(entry.abi): entry.abi for entry in entries}
+        abis_section = {abi_hash: sort_abi(abis[abi_hash]) for abi_hash in sorted(abis)}
+        sections[COMPACT_REGISTRY_ABIS_KEY] = abis_section
+    for chain_id, entries in chain_entries.items():
+        sections[chain_id] = _chain_section(entries, compact=compact, selectors=selectors)
+
+    encoded_sections = [
+        (key, _encode_section(section, reuse=reuse_sections)) for key, section in sections.items()
+    ]
+    return _join_sections(encoded_sections).encode()
+
+
+def _write_atomically(filepath: Path, data: bytes) -> None:
+    """Writes data to a temporary file, syncs it to disk and then moves it into place."""
+    mode = stat.S_IMODE(filepath.stat().st_mode) if filepath.exists() else 0o644
+    fd, temp_filepath = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_filepath, mode)
+        os.replace(temp_filepath, filepath)
+    except BaseException:
+        Path(temp_filepath).unlink(missing_ok=True)
+        raise
+
+
+def write_registry(
+    entries: List[RegistryEntry],
+    filepath: Path,
+    silent: bool = False,
+    compact: Optional[bool] = None,
+    overwrite: bool = False,
+    selectors: Optional[bool] = None,
+) -> Path:
+    """
+    Writes a nucypher-style contract registry to a file.
+
+    If `compact` is True, ABIs are deduplicated into a top-level section and referenced
+    by fingerprint. If `selectors` is True, each entry also lists the 4-byte selectors
+    of its functions and errors and the topics of its events. If not specified, the
+    format of an existing registry file is preserved, otherwise the verbose format
+    without selectors is used. Entries are merged into an existing
+    registry unless `overwrite` is True. The file is replaced atomically, and not at all
+    if its contents would not change.
+    """
+    document = _read_registry_document(filepath) if filepath.exists() else None
+    return _write_registry(
+        entries=entries,
+        filepath=filepath,
+        document=document,
+        silent=silent,
+        compact=compact,
+        overwrite=overwrite,
+        selectors=selectors,
+    )
+
+
+def _write_registry(
+    entries: List[RegistryEntry],
+    filepath: Path,
+    document: Optional[_RegistryDocument],
+    silent: bool,
+    compact: Optional[bool],
+    overwrite: bool,
+    selectors: Optional[bool],
+    reuse_sections: bool = True,
+) -> Path:
+    """Writes a registry to a file, given the already decoded registry `document` there."""
+    if not entries:
+        print("No entries provided.")
+        return filepath
+
+    # Sort registry entries to enforce common order
+    # See https://github.com/nucypher/nucypher-contracts/issues/192
+    entries.sort(key=lambda entry: (str(entry.chain_id), entry.name))
 
     # Create the parent directory if it does not exist
     filepath.parent.mkdir(parents=True, exist_ok=True)
 
     # If the file already exists, attempt to merge the data, if not create a new file
-    if filepath.exists():
-        if not silent:
-            print(f"Updating existing registry at {filepath}.")
-        existing_data = _load_json(filepath)
-
-        if any(chain_id in existing_data for chain_id in data):
-            filepath = filepath.with_suffix(".unmerged.json")
+    existing_content = None
+    if document is not None:
+        existing_content = document.content
+        if compact is None:
+            compact = document.compact
+        if selectors is None:
+            selectors = document.selectors
+        if not overwrite:
             if not silent:
-                print(
-                    "Cannot merge registries with overlapping chain IDs.\n"
-                    f"Writing to {filepath} to avoid overwriting existing data."
-                )
-        else:
-            existing_data.update(data)
-            data = existing_data
+                print(f"Updating existing registry at {filepath}.")
+            existing_entries = document.entries
+
+            existing_chain_ids = {entry.chain_id for entry in existing_entries}
+            if any(entry.chain_id in existing_chain_ids for entry in entries):
+                filepath = filepath.with_suffix(".unmerged.json")
+                existing_content = filepath.read_bytes() if filepath.exists() else None
+                if not silent:
+                    print(
+                        "Cannot merge registries with overlapping chain IDs.\n"
+                        f"Writing to {filepath} to avoid overwriting existing data."
+                    )
+            else:
+                entries = existing_entries + entries
     elif not silent:
         print(f"Creating new registry at {filepath}.")
 
-    with open(filepath, "w") as file:
-        json.dump(data, file, **STANDARD_REGISTRY_JSON_FORMAT)
+    data = _encode_registry(
+        entries=entries,
+        compact=bool(compact),
+        selectors=bool(selectors),
+        reuse_sections=reuse_sections,
+    )
+    if data == existing_content:
+        if not silent:
+            print(f"Registry at {filepath} is unchanged.")
+        return filepath
 
+    _write_atomically(filepath, data)
     return filepath
 
 
@@ -210,7 +863,7 @@ def _select_conflict_resolution(
 
 
 def registry_from_ape_deployments(
-    deployments: List[ContractInstance],
+    deployments: List["ContractInstance"],
     output_filepath: Path,
     registry_names: Optional[Dict[ContractName, ContractName]] = None,
 ) -> Path:
@@ -222,6 +875,137 @@ def registry_from_ape_deployments(
     return output_filepath
 
 
+class MergeStrategy(Enum):
+    """Declarative rule for resolving registry entries with the same name on the same chain."""
+
+    NEWEST = "newest"  # entry with the highest block number wins (ties go to the last registry)
+    FIRST = "first"  # entry from the first registry wins
+    LAST = "last"  # entry from the last registry wins
+
+
+MergeCandidate = Tuple[Path, RegistryEntry]
+
+
+class MergeConflict(NamedTuple):
+    """Two or more differing registry entries with the same name on the same chain."""
+
+    chain_id: ChainId
+    name: ContractName
+    candidates: List[MergeCandidate]
+    selected: MergeCandidate
+    resolution: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        def _candidate(candidate: MergeCandidate) -> Dict[str, Any]:
+            filepath, entry = candidate
+            return {
+                "registry": str(filepath),
+                "address": entry.address,
+                "block_number": int(entry.block_number),
+            }
+
+        return {
+            "chain_id": self.chain_id,
+            "name": self.name,
+            "resolution": self.resolution,
+            "selected": _candidate(self.selected),
+            "candidates": [_candidate(candidate) for candidate in self.candidates],
+        }
+
+
+def merge_registry_entries(
+    registries: List[Tuple[Path, List[RegistryEntry]]],
+    strategy: MergeStrategy = MergeStrategy.NEWEST,
+    overrides: Optional[Dict[ContractName, Path]] = None,
+    deprecated_contracts: Optional[List[ContractName]] = None,
+    conflict_resolver: Optional[Callable[[List[MergeCandidate]], MergeCandidate]] = None,
+) -> Tuple[List[RegistryEntry], List[MergeConflict]]:
+    """
+    Merges the entries of any number of registries in a single pass.
+
+    Entries with the same name on the same chain are resolved by, in order of precedence,
+    a per-name override (the registry to take the entry from), the optional
+    `conflict_resolver` callback, and the merge strategy. Deprecated contracts are dropped.
+    Returns the merged entries and every conflict between differing entries.
+    """
+    # registries are matched by resolved path, however their filepaths are spelled
+    resolved_filepaths = {Path(filepath): Path(filepath).resolve() for filepath, _ in registries}
+    overrides = {name: Path(filepath).resolve() for name, filepath in (overrides or dict()).items()}
+    for name, filepath in overrides.items():
+        if filepath not in resolved_filepaths.values():
+            raise ValueError(f"Override for '{name}' does not name a merged registry: {filepath}")
+    deprecated_contracts = set(deprecated_contracts or [])
+
+    candidates: Dict[Tuple[ChainId, ContractName], List[MergeCandidate]] = defaultdict(list)
+    for filepath, entries in registries:
+        for entry in entries:
+            if entry.name in deprecated_contracts:
+                continue
+            candidates[(entry.chain_id, entry.name)].append((Path(filepath), entry))
+
+    merged: List[RegistryEntry] = list()
+    conflicts: List[MergeConflict] = list()
+    for (chain_id, name), entry_candidates in candidates.items():
+        override = overrides.get(name)
+        overridden = [c for c in entry_candidates if resolved_filepaths[c[0]] == override]
+        # the ABI is part of an entry's identity: e.g. a proxy upgrade keeps the address and
+        # deployment transaction but changes the ABI, and must be resolved like any conflict
+        distinct_entries = {
+            (e.address, e.tx_hash, _cached_abi_fingerprint(e.abi)) for _, e in entry_candidates
+        }
+        if overridden:
+            selected, resolution = overridden[-1], "override"
+        elif len(distinct_entries) > 1 and conflict_resolver:
+            selected, resolution = conflict_resolver(entry_candidates), "resolver"
+        elif strategy == MergeStrategy.NEWEST:
+            selected = max(reversed(entry_candidates), key=lambda c: int(c[1].block_number))
+            resolution = strategy.value
+        elif strategy == MergeStrategy.FIRST:
+            selected, resolution = entry_candidates[0], strategy.value
+        else:
+            selected, resolution = entry_candidates[-1], strategy.value
+
+        merged.append(selected[1])
+        if len(distinct_entries) > 1:
+            conflict = MergeConflict(
+                chain_id=chain_id,
+                name=name,
+                candidates=entry_candidates,
+                selected=selected,
+                resolution=resolution,
+            )
+            conflicts.append(conflict)
+
+    return merged, conflicts
+
+
+def merge_registry_files(
+    registry_filepaths: List[Path],
+    output_filepath: Path,
+    strategy: MergeStrategy = MergeStrategy.NEWEST,
+    overrides: Optional[Dict[ContractName, Path]] = None,
+    deprecated_contracts: Optional[List[ContractName]] = None,
+    conflict_resolver: Optional[Callable[[List[MergeCandidate]], MergeCandidate]] = None,
+) -> Tuple[Path, List[MergeConflict]]:
+    """
+    Merges any number of nucypher-style contract registries into a single registry file.
+    See `merge_registry_entries` for how conflicts are resolved.
+    """
+    registries = [(Path(filepath), read_registry(filepath)) for filepath in registry_filepaths]
+    merged, conflicts = merge_registry_entries(
+        registries=registries,
+        strategy=strategy,
+        overrides=overrides,
+        deprecated_contracts=deprecated_contracts,
+        conflict_resolver=conflict_resolver,
+    )
+
+    # Write the merged registry to the specified output file path
+    output_filepath = write_registry(entries=merged, filepath=output_filepath)
+    print(f"Merged registry output to {output_filepath}")
+    return output_filepath, conflicts
+
+
 def merge_registries(
     registry_1_filepath: Path,
     registry_2_filepath: Path,
@@ -230,101 +1014,239 @@ def merge_registries(
     force_conflict_resolution: ConflictResolution = None,
 ) -> Path:
     """Merges two nucypher-style contract registries created from ape deployments API."""
-    # If no deprecated contracts are specified, use an empty list
-    deprecated_contracts = deprecated_contracts or []
 
-    # Read the registries, excluding deprecated contracts
-    reg1 = defaultdict(OrderedDict)
-    reg2 = defaultdict(OrderedDict)
+    def _resolve_conflict(candidates: List[MergeCandidate]) -> MergeCandidate:
+        (_, entry_1), (_, entry_2) = candidates
+        resolution = force_conflict_resolution or _select_conflict_resolution(
+            registry_1_entry=entry_1,
+            registry_2_entry=entry_2,
+            registry_1_filepath=registry_1_filepath,
+            registry_2_filepath=registry_2_filepath,
+        )
+        return candidates[0] if resolution == ConflictResolution.USE_1 else candidates[1]
 
-    for e in read_registry(registry_1_filepath):
-        if e.name in deprecated_contracts:
-            continue
-        reg1[e.chain_id][e.name] = e
+    output_filepath, _ = merge_registry_files(
+        registry_filepaths=[registry_1_filepath, registry_2_filepath],
+        output_filepath=output_filepath,
+        deprecated_contracts=deprecated_contracts,
+        conflict_resolver=_resolve_conflict,
+    )
+    return output_filepath
 
-    for e in read_registry(registry_2_filepath):
-        if e.name in deprecated_contracts:
-            continue
-        reg2[e.chain_id][e.name] = e
 
-    merged: List[RegistryEntry] = list()
+class AbiChange(NamedTuple):
+    """Selector-level difference between two ABIs of the same contract."""
 
-    # Iterate over all chains and unique contract names across both registries
-    all_chains = set(reg1) | set(reg2)
-    common_chains = set(reg1) & set(reg2)
-    for chain in all_chains:
-        reg1_chain_entries, reg2_chain_entries = reg1.get(chain, {}), reg2.get(chain, {})
-        if chain in common_chains:
-            # check for conflicting contracts
-            all_contracts = set(reg1_chain_entries) | set(reg2_chain_entries)
-            for name in all_contracts:
-                entry_1, entry_2 = reg1_chain_entries.get(name), reg2_chain_entries.get(name)
-                if entry_1 and entry_2:
-                    # entries for the same name (same chain)
-                    resolution = force_conflict_resolution or _select_conflict_resolution(
-                        registry_1_entry=entry_1,
-                        registry_2_entry=entry_2,
-                        registry_1_filepath=registry_1_filepath,
-                        registry_2_filepath=registry_2_filepath,
-                    )
-                    selected_entry = entry_1 if resolution == ConflictResolution.USE_1 else entry_2
-                else:
-                    selected_entry = entry_1 or entry_2
+    added: Dict[str, str]
+    removed: Dict[str, str]
 
-                # commit the selected entry
-                merged.append(selected_entry)
-        else:
-            # not a common chain so just move on right along
-            selected_entries = reg1_chain_entries or reg2_chain_entries
-            merged.extend(list(selected_entries.values()))
+    def to_dict(self) -> Dict[str, Any]:
+        return {"added": sorted(self.added.values()), "removed": sorted(self.removed.values())}
 
-    # Write the merged registry to the specified output file path
-    write_registry(entries=merged, filepath=output_filepath)
-    print(f"Merged registry output to {output_filepath}")
-    return output_filepath
+
+def _diff_abis(abi_1: ABI, abi_2: ABI) -> Dict[str, AbiChange]:
+    selectors_1, selectors_2 = abi_selectors(abi_1), abi_selectors(abi_2)
+    changes = dict()
+    for kind, table_1, table_2 in zip(AbiSelectors._fields, selectors_1, selectors_2):
+        added = {s: table_2[s] for s in table_2.keys() - table_1.keys()}
+        removed = {s: table_1[s] for s in table_1.keys() - table_2.keys()}
+        if added or removed:
+            changes[kind] = AbiChange(added=added, removed=removed)
+    return changes
+
+
+class RegistryDiff(NamedTuple):
+    """Structural differences between two registries on a single chain."""
+
+    chain_id: ChainId
+    added: List[RegistryEntry]
+    removed: List[RegistryEntry]
+    moved: List[Tuple[RegistryEntry, RegistryEntry]]  # same name, different address
+    redeployed: List[Tuple[RegistryEntry, RegistryEntry]]  # same address, different deployment
+    abi_changes: Dict[ContractName, Dict[str, AbiChange]]
+
+    def __bool__(self) -> bool:
+        return any((self.added, self.removed, self.moved, self.redeployed, self.abi_changes))
+
+    def to_dict(self) -> Dict[str, Any]:
+        def _entry(entry: RegistryEntry) -> Dict[str, Any]:
+            return {
+                "name": entry.name,
+                "address": entry.address,
+                "tx_hash": entry.tx_hash,
+                "block_number": int(entry.block_number),
+                "deployer": entry.deployer,
+            }
+
+        return {
+            "chain_id": self.chain_id,
+            "added": [_entry(entry) for entry in self.added],
+            "removed": [_entry(entry) for entry in self.removed],
+            "moved": [{"from": _entry(e1), "to": _entry(e2)} for e1, e2 in self.moved],
+            "redeployed": [{"from": _entry(e1), "to": _entry(e2)} for e1, e2 in self.redeployed],
+            "abi_changes": {
+                name: {kind: change.to_dict() for kind, change in changes.items()}
+                for name, changes in self.abi_changes.items()
+            },
+        }
 
 
-def contracts_from_registry(filepath: Path, chain_id: ChainId) -> Dict[str, ContractInstance]:
-    """Returns a dictionary of contract instances from a nucypher-style contract registry."""
-    registry_entries = read_registry(filepath=filepath)
-    deployments = dict()
-    for registry_entry in registry_entries:
-        if registry_entry.chain_id != chain_id:
+def diff_registries(
+    entries_1: List[RegistryEntry], entries_2: List[RegistryEntry]
+) -> Dict[ChainId, RegistryDiff]:
+    """
+    Structurally compares two sets of registry entries, keyed by (chain id, name).
+    ABIs are compared by fingerprint and only ABIs that differ are broken down into
+    per-selector changes. Only chains with differences are included in the result.
+    """
+    by_key_1 = {(entry.chain_id, entry.name): entry for entry in entries_1}
+    by_key_2 = {(entry.chain_id, entry.name): entry for entry in entries_2}
+
+    diffs = dict()
+
+    def _chain_diff(chain_id: ChainId) -> RegistryDiff:
+        if chain_id not in diffs:
+            diffs[chain_id] = RegistryDiff(
+                chain_id=chain_id, added=[], removed=[], moved=[], redeployed=[], abi_changes={}
+            )
+        return diffs[chain_id]
+
+    for key, entry_1 in by_key_1.items():
+        entry_2 = by_key_2.get(key)
+        if entry_2 is None:
+            _chain_diff(entry_1.chain_id).removed.append(entry_1)
             continue
-        contract_type = registry_entry.name
-        contract_container = get_contract_container(contract_type)
-        contract_instance = contract_container.at(registry_entry.address)
-        deployments[contract_type] = contract_instance
-    return deployments
+        if entry_1.address != entry_2.address:
+            _chain_diff(entry_1.chain_id).moved.append((entry_1, entry_2))
+        elif (entry_1.tx_hash, entry_1.block_number, entry_1.deployer) != (
+            entry_2.tx_hash,
+            entry_2.block_number,
+            entry_2.deployer,
+        ):
+            _chain_diff(entry_1.chain_id).redeployed.append((entry_1, entry_2))
+        if _cached_abi_fingerprint(entry_1.abi) != _cached_abi_fingerprint(entry_2.abi):
+            abi_changes = _diff_abis(entry_1.abi, entry_2.abi)
+            if not abi_changes:
+                # same selectors but e.g. different parameter names or mutability
+                abi_changes = {"other": AbiChange(added=dict(), removed=dict())}
+            _chain_diff(entry_1.chain_id).abi_changes[entry_1.name] = abi_changes
+
+    for key, entry_2 in by_key_2.items():
+        if key not in by_key_1:
+            _chain_diff(entry_2.chain_id).added.append(entry_2)
+
+    return {chain_id: diffs[chain_id] for chain_id in sorted(diffs)}
+
+
+class LazyContracts(Mapping):
+    """
+    Read-only mapping of contract name to contract instance for a single chain.
+    Contract instances are only materialized on first access.
+    """
+
+    def __init__(self, registry: Registry, chain_id: ChainId):
+        self._registry = registry
+        self._chain_id = chain_id
+        self._names = [entry.name for entry in registry.chain_entries(chain_id)]
+
+    def __getitem__(self, name: ContractName) -> "ContractInstance":
+        try:
+            return self._registry.get_contract(chain_id=self._chain_id, name=name)
+        except NoContractFound:
+            raise KeyError(name)
+
+    def __iter__(self) -> Iterator[ContractName]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} chain_id={self._chain_id} contracts={self._names}>"
+
+
+def contracts_from_registry(filepath: Path, chain_id: ChainId) -> Mapping[str, "ContractInstance"]:
+    """
+    Returns a mapping of contract instances from a nucypher-style contract registry.
+    Instances are created lazily on first access.
+    """
+    registry = Registry.from_file(filepath)
+    return LazyContracts(registry=registry, chain_id=chain_id)
+
+
+def convert_registry(
+    filepath: Path, output_filepath: Path, compact: bool, selectors: Optional[bool] = None
+) -> Path:
+    """
+    Rewrites a registry file in either the compact or the verbose format, optionally
+    adding (or removing) the selector and topic tables of its entries.
+    """
+    document = _read_registry_document(filepath)
+    return _convert_registry(
+        document=document, output_filepath=output_filepath, compact=compact, selectors=selectors
+    )
+
+
+def _convert_registry(
+    document: _RegistryDocument,
+    output_filepath: Path,
+    compact: bool,
+    selectors: Optional[bool] = None,
+    reuse_sections: bool = True,
+) -> Path:
+    """Rewrites an already decoded registry, see `convert_registry`."""
+    if selectors is None:
+        selectors = document.selectors
+    output_filepath = Path(output_filepath)
+    if output_filepath.resolve() == document.filepath.resolve():
+        output_document = document
+    elif output_filepath.exists():
+        output_document = _read_registry_document(output_filepath)
+    else:
+        output_document = None
+    _write_registry(
+        entries=list(document.entries),
+        filepath=output_filepath,
+        document=output_document,
+        silent=True,
+        compact=compact,
+        overwrite=True,
+        selectors=selectors,
+        reuse_sections=reuse_sections,
+    )
+    return output_filepath
 
 
 def normalize_registry(filepath: Path):
-    """Normalizes a potentially non-standard registry file."""
+    """Normalizes a potentially non-standard registry file, preserving its format."""
     try:
-        registry_entries = read_registry(filepath=filepath)
+        document = _read_registry_document(filepath)
     except Exception:
         print(f"Error when reading registry at {filepath}.")
         raise
 
     try:
-        temp_filepath = filepath.with_suffix(".temp.json")
-        write_registry(entries=registry_entries, filepath=temp_filepath, silent=True)
-        shutil.copy(temp_filepath, filepath)
-        temp_filepath.unlink()
+        # always re-encoded, so that the result is in the canonical layout
+        _convert_registry(
+            document=document,
+            output_filepath=filepath,
+            compact=document.compact,
+            reuse_sections=False,
+        )
         print(f"Successfully normalized registry at {filepath}.")
     except Exception:
         print(f"Error when normalizing registry at {filepath}.")
         raise
 
 
-def get_contract(domain: str, contract_name: str) -> ContractInstance:
+def get_contract(domain: str, contract_name: str) -> "ContractInstance":
     """Returns the contract instance for the contract name and domain."""
     registry_filepath = registry_filepath_from_domain(domain=domain)
-    chain_id = project.chain_manager.chain_id
-    deployments = contracts_from_registry(filepath=registry_filepath, chain_id=chain_id)
+    chain_id = ape.project.chain_manager.chain_id
+    registry = Registry.from_file(registry_filepath)
     try:
-        return deployments[contract_name]
-    except KeyError:
+        return registry.get_contract(chain_id=chain_id, name=contract_name)
+    except NoContractFound:
         raise NoContractFound(
             f"Contract '{contract_name}' not found in {domain} registry for chain {chain_id}. "
             "Are you connected to the correct network + domain?"
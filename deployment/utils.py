@@ -2,12 +2,11 @@ import json
 import os
 import random
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import ape
 import requests
 import yaml
-from ape import networks, project
-from ape.contracts import ContractContainer, ContractInstance
 from ape.exceptions import NetworkError
 from ape_etherscan.utils import API_KEY_ENV_KEY_MAP
 from eth_utils import to_checksum_address
@@ -15,6 +14,10 @@ from eth_utils import to_checksum_address
 from deployment.constants import ARTIFACTS_DIR, MAINNET, PORTER_SAMPLING_ENDPOINTS
 from deployment.networks import is_local_network
 
+if TYPE_CHECKING:
+    # ape's contract (and network) machinery is loaded on first use, not on import
+    from ape.contracts import ContractContainer, ContractInstance
+
 
 def _load_yaml(filepath: Path) -> dict:
     """Loads a YAML file."""
@@ -38,10 +41,11 @@ def get_artifact_filepath(config: Dict) -> Path:
     return artifact_dir / filename
 
 
-def validate_config(config: Dict) -> Path:
+def validate_config(config: Dict, dry_run: bool = False) -> Path:
     """
     Checks that the deployment has not already been published for
-    the chain_id specified in the params file.
+    the chain_id specified in the params file (unless it is a dry run,
+    which is never published).
     """
     print("Validating parameters YAML...")
 
@@ -60,19 +64,21 @@ def validate_config(config: Dict) -> Path:
     config_chain_id = int(
         config_chain_id
     )  # Convert chain_id to int here after ensuring it is not None
-    chain_mismatch = config_chain_id != networks.provider.network.chain_id
+    chain_mismatch = config_chain_id != ape.networks.provider.network.chain_id
     live_deployment = not is_local_network()
     if chain_mismatch and live_deployment:
         raise ValueError(
             f"chain_id in params file ({config_chain_id}) does not match "
-            f"chain_id of current network ({networks.provider.network.chain_id})."
+            f"chain_id of current network ({ape.networks.provider.network.chain_id})."
         )
 
     registry_filepath = get_artifact_filepath(config=config)
-    if not registry_filepath.exists():
+    if dry_run or not registry_filepath.exists():
         return registry_filepath
 
-    registry_chain_ids = map(int, _load_json(registry_filepath).keys())
+    # skip non-chain sections e.g. the deduplicated ABIs of compact registries
+    registry_sections = _load_json(registry_filepath).keys()
+    registry_chain_ids = [int(section) for section in registry_sections if section.isdigit()]
     if config_chain_id in registry_chain_ids:
         raise ValueError(f"Deployment is already published for chain_id {config_chain_id}.")
 
@@ -91,7 +97,7 @@ def check_etherscan_plugin() -> None:
         import ape_etherscan  # noqa: F401
     except ImportError:
         raise ImportError("Please install the ape-etherscan plugin to use this script.")
-    ecosystem_name = networks.provider.network.ecosystem.name
+    ecosystem_name = ape.networks.provider.network.ecosystem.name
     explorer_envvar = API_KEY_ENV_KEY_MAP.get(ecosystem_name)
     api_key = os.environ.get(explorer_envvar)
     if not api_key:
@@ -102,7 +108,7 @@ def check_infura_plugin() -> None:
     """Checks that the ape-infura plugin is installed."""
     if is_local_network():
         return  # unnecessary for local deployment
-    if networks.provider.name != "infura":
+    if ape.networks.provider.name != "infura":
         return  # unnecessary when using a provider different than infura
     try:
         import ape_infura  # noqa: F401
@@ -120,8 +126,8 @@ def check_infura_plugin() -> None:
         )
 
 
-def verify_contracts(contracts: List[ContractInstance]) -> None:
-    explorer = networks.provider.network.explorer
+def verify_contracts(contracts: List["ContractInstance"]) -> None:
+    explorer = ape.networks.provider.network.explorer
     for instance in contracts:
         print(f"(i) Verifying {instance.contract_type.name}...")
         explorer.publish_contract(instance.address)
@@ -133,29 +139,92 @@ def check_plugins() -> None:
     check_infura_plugin()
 
 
-def _get_dependency_contract_container(contract: str) -> ContractContainer:
-    for dependency_name, dependency_versions in project.dependencies.items():
+# Contract containers by name, resolved once per process
+_CONTRACT_CONTAINERS: Dict[str, "ContractContainer"] = dict()
+
+# Contract containers of the dependencies by name (the first dependency defining a name wins),
+# and the first dependency with more than one version, past which names cannot be resolved;
+# built once, on the first lookup of a non-project contract
+_DEPENDENCY_CONTAINERS: Optional[Dict[str, "ContractContainer"]] = None
+_AMBIGUOUS_DEPENDENCY: Optional[str] = None
+
+
+def _build_dependency_index() -> Dict[str, "ContractContainer"]:
+    """Indexes the contract containers of the project dependencies, in dependency order."""
+    global _AMBIGUOUS_DEPENDENCY
+    _AMBIGUOUS_DEPENDENCY = None
+    index = dict()
+    for dependency_name, dependency_versions in ape.project.dependencies.items():
         if len(dependency_versions) > 1:
-            raise ValueError(f"Ambiguous {dependency_name} dependency for {contract}")
-        try:
-            dependency_api = list(dependency_versions.values())[0]
-            contract_container = getattr(dependency_api, contract)
-            return contract_container
-        except AttributeError:
-            continue
-    raise ValueError(f"No contract found with name '{contract}'.")
+            _AMBIGUOUS_DEPENDENCY = dependency_name
+            break
+        for dependency_api in dependency_versions.values():
+            for contract_name, contract_container in dependency_api.contracts.items():
+                index.setdefault(contract_name, contract_container)
+    return index
+
+
+def _get_dependency_contract_container(contract: str) -> "ContractContainer":
+    global _DEPENDENCY_CONTAINERS
+    if _DEPENDENCY_CONTAINERS is None:
+        _DEPENDENCY_CONTAINERS = _build_dependency_index()
+
+    try:
+        return _DEPENDENCY_CONTAINERS[contract]
+    except KeyError:
+        if _AMBIGUOUS_DEPENDENCY:
+            raise ValueError(f"Ambiguous {_AMBIGUOUS_DEPENDENCY} dependency for {contract}")
+        raise ValueError(f"No contract found with name '{contract}'.")
+
 
+def get_contract_container(contract: str) -> "ContractContainer":
+    contract_container = _CONTRACT_CONTAINERS.get(contract)
+    if contract_container is not None:
+        return contract_container
 
-def get_contract_container(contract: str) -> ContractContainer:
     try:
-        contract_container = getattr(project, contract)
+        contract_container = getattr(ape.project, contract)
     except AttributeError:
         # not in root project; check dependencies
         contract_container = _get_dependency_contract_container(contract)
 
+    _CONTRACT_CONTAINERS[contract] = contract_container
     return contract_container
 
 
+def batch_rpc_requests(calls: List[Tuple[str, List[Any]]]) -> List[Any]:
+    """
+    Sends RPC calls to the connected provider as a single JSON-RPC batch request and
+    returns their results in order. Providers without an HTTP endpoint (e.g. the local
+    test provider) are queried sequentially instead.
+    """
+    if not calls:
+        return []
+
+    http_uri = ape.networks.provider.http_uri
+    if not http_uri:
+        return [ape.networks.provider.make_request(method, params) for method, params in calls]
+
+    payload = [
+        {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+        for request_id, (method, params) in enumerate(calls)
+    ]
+    response = requests.post(http_uri, json=payload, timeout=60)
+    response.raise_for_status()
+    responses = response.json()
+    if not isinstance(responses, list):
+        raise ValueError(f"RPC endpoint does not support batch requests: {responses}")
+
+    responses_by_id = {r["id"]: r for r in responses}
+    results = list()
+    for request_id, (method, _) in enumerate(calls):
+        result = responses_by_id[request_id]
+        if "error" in result:
+            raise ValueError(f"Batched RPC call '{method}' failed: {result['error']}")
+        results.append(result["result"])
+    return results
+
+
 def registry_filepath_from_domain(domain: str) -> Path:
     p = ARTIFACTS_DIR / f"{domain}.json"
     if not p.exists():
@@ -166,7 +235,7 @@ def registry_filepath_from_domain(domain: str) -> Path:
 
 def get_chain_name(chain_id: int) -> str:
     """Returns the name of the chain given its chain ID."""
-    for ecosystem_name, ecosystem in networks.ecosystems.items():
+    for ecosystem_name, ecosystem in ape.networks.ecosystems.items():
         for network_name, network in ecosystem.networks.items():
             try:
                 if network.chain_id == chain_id:
@@ -203,6 +272,7 @@ def sample_nodes(
         nodes = [to_checksum_address(node) for node in excluded_nodes]
         params["exclude_ursulas"] = ",".join(nodes)
 
+    # samples are random, so they bypass the HTTP cache (see deployment/http_cache.py)
     response = requests.get(porter_endpoint, params=params)
     response.raise_for_status()
 
@@ -247,7 +317,7 @@ def _generate_heartbeat_cohorts(addresses: List[str]) -> Tuple[Tuple[str, ...],
 
 
 def get_heartbeat_cohorts(
-    taco_application: ContractContainer, excluded_nodes: Optional[List[str]] = []
+    taco_application: "ContractContainer", excluded_nodes: Optional[List[str]] = []
 ) -> Tuple[Tuple[str, ...], ...]:
     active_stakes_data = taco_application.getActiveStakingProviders(
         0,  # start index
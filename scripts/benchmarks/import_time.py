@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+SCRIPTS_DIR = Path(__file__).parent.parent
+PROJECT_DIR = SCRIPTS_DIR.parent
+
+# Runs in a fresh interpreter so that nothing is imported yet; only the execution of the
+# script module (i.e. its imports and module level code, not its entry point) is timed.
+IMPORT_SNIPPET = """
+import importlib.util, sys, time
+sys.path.insert(0, sys.argv[2])
+spec = importlib.util.spec_from_file_location("script", sys.argv[1])
+module = importlib.util.module_from_spec(spec)
+start = time.perf_counter()
+spec.loader.exec_module(module)
+print(time.perf_counter() - start)
+"""
+
+
+def _import_time(script: Path, timeout: int) -> float:
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SNIPPET, str(script), str(PROJECT_DIR)],
+        cwd=PROJECT_DIR,
+        text=True,
+        stderr=subprocess.DEVNULL,
+        timeout=timeout,
+    )
+    return float(output.strip().splitlines()[-1])
+
+
+@click.command()
+@click.option("--samples", "-n", help="Number of imports per script", default=3, type=int)
+@click.option("--timeout", help="Seconds after which an import is abandoned", default=120, type=int)
+@click.argument("scripts", nargs=-1, type=click.Path(exists=True, dir_okay=False, path_type=Path))
+def cli(samples, timeout, scripts):
+    """Measure the cold import time of script entry points (all scripts by default)."""
+    scripts = scripts or sorted(
+        script
+        for script in SCRIPTS_DIR.rglob("*.py")
+        if Path(__file__).parent not in script.parents
+    )
+    for script in scripts:
+        name = script.resolve().relative_to(SCRIPTS_DIR.resolve())
+        try:
+            times = [_import_time(script, timeout=timeout) for _ in range(samples)]
+        except subprocess.TimeoutExpired:
+            print(f"{name}: timed out after {timeout}s")
+            continue
+        except subprocess.CalledProcessError:
+            print(f"{name}: failed to import")
+            continue
+        print(f"{name}: {statistics.median(times) * 1000:.0f}ms")
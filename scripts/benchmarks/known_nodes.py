@@ -0,0 +1,63 @@
+#!/usr/bin/python3
+import random
+import time
+
+import click
+from eth_utils import keccak, to_checksum_address
+
+from deployment.nodes import KnownNodes
+
+
+def _fake_address(seed: str) -> str:
+    return to_checksum_address(keccak(text=seed)[-20:])
+
+
+def _scan_known_node(staker_address: str, network_data: dict):
+    """The previous lookup: a scan of all known nodes, per participant."""
+    for node in network_data["known_nodes"]:
+        if node.get("staker_address") == staker_address:
+            return node
+    return None
+
+
+@click.command()
+@click.option("--known-nodes", help="Number of known nodes of the network", default=5000, type=int)
+@click.option("--rituals", help="Number of heartbeat rituals", default=50, type=int)
+@click.option("--cohort-size", help="Number of participants per ritual", default=30, type=int)
+@click.option("--seed", help="Random seed of the cohort sampling", default=0, type=int)
+def cli(known_nodes, rituals, cohort_size, seed):
+    """Compare known node lookups of heartbeat participants by scan and by index."""
+    network_data = {
+        "known_nodes": [
+            {
+                "staker_address": _fake_address(f"staker-{i}"),
+                "operator_address": _fake_address(f"operator-{i}"),
+                "rest_url": f"node-{i}.example:9151",
+            }
+            for i in range(known_nodes)
+        ]
+    }
+    stakers = [node["staker_address"] for node in network_data["known_nodes"]]
+    rng = random.Random(seed)
+    participants = [
+        address for _ in range(rituals) for address in rng.sample(stakers, k=cohort_size)
+    ]
+
+    start = time.perf_counter()
+    scanned = [_scan_known_node(address, network_data) for address in participants]
+    scan_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = KnownNodes(network_data)
+    build_time = time.perf_counter() - start
+    start = time.perf_counter()
+    indexed = [index.get(address) for address in participants]
+    index_time = time.perf_counter() - start
+
+    assert scanned == indexed
+    total_index_time = build_time + index_time
+    print(
+        f"{len(participants)} lookups among {known_nodes} known nodes: "
+        f"scan={scan_time * 1000:.2f}ms index={total_index_time * 1000:.2f}ms "
+        f"(build {build_time * 1000:.2f}ms; x{scan_time / total_index_time:.1f})"
+    )
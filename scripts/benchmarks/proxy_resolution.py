@@ -0,0 +1,120 @@
+#!/usr/bin/python3
+import re
+import time
+from pathlib import Path
+
+import click
+from ape import chain, networks
+from ape_ethereum.proxies import ProxyInfo, ProxyType
+from eth_utils import keccak, to_checksum_address
+
+from deployment.constants import CONSTRUCTOR_PARAMS_DIR
+from deployment.params import _get_proxy_address, _index_proxy
+from deployment.utils import _load_yaml
+
+# Every $ContractName reference is resolved once per phase:
+# eager validation, confirmation, deployment and encoding
+RESOLUTIONS_PER_REFERENCE = 4
+
+
+def _fake_address(seed: str) -> str:
+    return to_checksum_address(keccak(text=seed)[-20:])
+
+
+def _contract_references(config: dict) -> list:
+    """Returns the $ContractName references of a constructor parameters file."""
+    contract_names = {name for contract in config["contracts"] for name in contract}
+    references = list()
+    for contract in config["contracts"]:
+        for name, contract_data in contract.items():
+            contract_data = contract_data or dict()
+            if "proxy" in contract_data:
+                references.append(name)  # the implicit proxy '_logic' parameter
+            parameters = str(contract_data.get("constructor", ""))
+            parameters += str((contract_data.get("proxy") or dict()).get("constructor", ""))
+            for reference in re.findall(r"\$(\w+)", parameters):
+                if reference in contract_names:
+                    references.append(reference)
+    return references
+
+
+def _scan_proxy_address(target_address: str):
+    """The previous resolution: a scan of all proxies known to ape, per reference."""
+    for proxy_address in chain.contracts.proxy_infos.memory.keys():
+        proxy_info = chain.contracts.get_proxy_info(proxy_address)
+        if proxy_info and proxy_info.target == target_address:
+            return proxy_address
+
+
+def _proxied_contracts(config: dict) -> set:
+    """Returns the names of the contracts deployed behind a proxy."""
+    return {
+        name
+        for contract in config["contracts"]
+        for name, contract_data in contract.items()
+        if "proxy" in (contract_data or dict())
+    }
+
+
+def _time_resolutions(resolve, names: list) -> tuple:
+    start = time.perf_counter()
+    resolved = [resolve(_fake_address(name)) for name in names]
+    return resolved, time.perf_counter() - start
+
+
+@click.command()
+@click.option(
+    "--constructor-params",
+    help="Constructor parameters file whose contract references are resolved",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    default=CONSTRUCTOR_PARAMS_DIR / "mainnet" / "child.yml",
+)
+@click.option(
+    "--known-proxies",
+    help="Number of (unrelated) proxies known to ape, e.g. from earlier deployments",
+    default=500,
+    type=int,
+)
+def cli(constructor_params, known_proxies):
+    """
+    Compare $ContractName proxy resolution by scanning proxies and by reverse index,
+    for references to proxied contracts (hits) and to other contracts (misses).
+    """
+    config = _load_yaml(constructor_params)
+    references = _contract_references(config) * RESOLUTIONS_PER_REFERENCE
+    proxied_names = _proxied_contracts(config)
+    hits = [name for name in references if name in proxied_names]
+    misses = [name for name in references if name not in proxied_names]
+
+    with networks.ethereum.local.use_provider("test"):
+        for i in range(known_proxies):
+            proxy_info = ProxyInfo(target=_fake_address(f"target-{i}"), type=ProxyType.Standard)
+            chain.contracts.cache_proxy_info(_fake_address(f"proxy-{i}"), proxy_info)
+        for name in proxied_names:
+            proxy_info = ProxyInfo(target=_fake_address(name), type=ProxyType.Standard)
+            chain.contracts.cache_proxy_info(_fake_address(f"proxy-{name}"), proxy_info)
+
+        scanned_hits, scan_hits_time = _time_resolutions(_scan_proxy_address, hits)
+        scanned_misses, scan_misses_time = _time_resolutions(_scan_proxy_address, misses)
+
+        # proxies deployed by this process are indexed by the Deployer; the unrelated ones
+        # known to ape are indexed on the first miss
+        for name in proxied_names:
+            _index_proxy(_fake_address(f"proxy-{name}"), _fake_address(name))
+        indexed_hits, index_hits_time = _time_resolutions(_get_proxy_address, hits)
+        indexed_misses, index_misses_time = _time_resolutions(_get_proxy_address, misses)
+
+    assert scanned_hits == indexed_hits
+    assert scanned_misses == indexed_misses == [None] * len(misses)
+    total_proxies = known_proxies + len(proxied_names)
+    for label, count, scan_time, index_time in (
+        ("proxied", len(hits), scan_hits_time, index_hits_time),
+        ("non-proxied", len(misses), scan_misses_time, index_misses_time),
+    ):
+        if not count:
+            continue
+        print(
+            f"{count} resolutions of {label} references with {total_proxies} known proxies: "
+            f"scan={scan_time * 1000:.2f}ms index={index_time * 1000:.2f}ms "
+            f"(x{scan_time / index_time:.1f})"
+        )
@@ -0,0 +1,60 @@
+#!/usr/bin/python3
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+
+from deployment.constants import ARTIFACTS_DIR, SUPPORTED_TACO_DOMAINS
+from deployment.registry import build_registry_snapshot, registry_snapshot_filepath
+
+# Runs in a fresh interpreter so that every sample is a cold (uncached) read; only the
+# registry load (including the snapshot freshness check) and a list_contracts.py-style pass
+# over its entries are timed, not the interpreter or ape start up.
+COLD_READ_SNIPPET = """
+import sys, time
+from pathlib import Path
+from deployment.registry import Registry
+filepath = Path(sys.argv[1])
+start = time.perf_counter()
+registry = Registry.from_file(filepath)
+names = [(entry.chain_id, entry.name, entry.address) for entry in registry.entries]
+print(time.perf_counter() - start)
+"""
+
+
+def _cold_read(filepath: Path) -> float:
+    output = subprocess.check_output(
+        [sys.executable, "-c", COLD_READ_SNIPPET, str(filepath)],
+        cwd=ARTIFACTS_DIR.parent.parent,
+        text=True,
+    )
+    return float(output.strip().splitlines()[-1])
+
+
+@click.command()
+@click.option("--samples", "-n", help="Number of cold reads per path", default=5, type=int)
+def cli(samples):
+    """Compare cold registry load times from JSON and from binary snapshots."""
+    for domain in SUPPORTED_TACO_DOMAINS:
+        filepath = ARTIFACTS_DIR / f"{domain}.json"
+        snapshot_filepath = registry_snapshot_filepath(filepath)
+        existing_snapshot = snapshot_filepath.read_bytes() if snapshot_filepath.exists() else None
+        try:
+            snapshot_filepath.unlink(missing_ok=True)
+            json_times = [_cold_read(filepath) for _ in range(samples)]
+            build_registry_snapshot(filepath)
+            snapshot_times = [_cold_read(filepath) for _ in range(samples)]
+        finally:
+            if existing_snapshot is None:
+                snapshot_filepath.unlink(missing_ok=True)
+            else:
+                snapshot_filepath.write_bytes(existing_snapshot)
+
+        json_ms = statistics.median(json_times) * 1000
+        snapshot_ms = statistics.median(snapshot_times) * 1000
+        print(
+            f"{domain}: json={json_ms:.2f}ms snapshot={snapshot_ms:.2f}ms "
+            f"(x{json_ms / snapshot_ms:.1f})"
+        )
@@ -0,0 +1,24 @@
+#!/usr/bin/python3
+from pathlib import Path
+
+import click
+
+from deployment.constants import ARTIFACTS_DIR
+from deployment.registry import build_registry_snapshot
+
+
+@click.command()
+@click.option(
+    "--registry",
+    "registries",
+    help="Filepath to registry file (defaults to all registries in the artifacts directory)",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    required=False,
+    multiple=True,
+)
+def cli(registries):
+    """Compile registry files into binary snapshots for faster loading."""
+    registries = registries or sorted(ARTIFACTS_DIR.glob("*.json"))
+    for registry_filepath in registries:
+        snapshot_filepath = build_registry_snapshot(registry_filepath)
+        print(f"Compiled {registry_filepath} into {snapshot_filepath}.")
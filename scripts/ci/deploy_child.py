@@ -1,12 +1,12 @@
 #!/usr/bin/python3
-import filecmp
+import json
 from pathlib import Path
 
 from ape import accounts, networks, project
 
 from deployment.constants import ARTIFACTS_DIR, CONSTRUCTOR_PARAMS_DIR
 from deployment.params import Deployer
-from deployment.registry import ConflictResolution, merge_registries
+from deployment.registry import ConflictResolution, diff_registries, merge_registries, read_registry
 
 VERIFY = False
 CONSTRUCTOR_PARAMS_FILEPATH = CONSTRUCTOR_PARAMS_DIR / "ci" / "child.yml"
@@ -55,25 +55,15 @@ def main():
             autosign=True,
         )
 
-        mock_polygon_child = deployer.deploy(project.MockPolygonChild)
-
-        taco_child_application = deployer.deploy(project.TACoChildApplication)
+        # independent deployments are broadcast together and awaited concurrently
+        deployments = deployer.deploy_all(pipelined=True)
+        mock_polygon_child = deployments["MockPolygonChild"]
+        taco_child_application = deployments["TACoChildApplication"]
+        coordinator = deployments["Coordinator"]
 
         deployer.transact(mock_polygon_child.setChildApplication, taco_child_application.address)
 
-        ritual_token = deployer.deploy(project.LynxRitualToken)
-
-        coordinator = deployer.deploy(project.Coordinator)
-
-        global_allow_list = deployer.deploy(project.GlobalAllowList)
-
-    deployments = [
-        mock_polygon_child,
-        taco_child_application,
-        ritual_token,
-        coordinator,
-        global_allow_list,
-    ]
+    deployments = list(deployments.values())
 
     deployer.finalize(deployments=deployments)
 
@@ -111,7 +101,10 @@ def main():
     )
 
     # diff
-    assert filecmp.cmp(ORIGINAL_DEPLOYMENT_ARTIFACT, FINAL_DEPLOYMENT_ARTIFACT, shallow=False)
+    diffs = diff_registries(
+        read_registry(ORIGINAL_DEPLOYMENT_ARTIFACT), read_registry(FINAL_DEPLOYMENT_ARTIFACT)
+    )
+    assert not diffs, json.dumps([diff.to_dict() for diff in diffs.values()], indent=4)
 
     # remove created files
     deployer.registry_filepath.unlink()
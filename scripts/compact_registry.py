@@ -0,0 +1,43 @@
+#!/usr/bin/python3
+from pathlib import Path
+
+import click
+
+from deployment.registry import convert_registry
+
+
+@click.command()
+@click.option(
+    "--registry",
+    help="Filepath to registry file",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    required=True,
+)
+@click.option(
+    "--output-registry",
+    "-o",
+    help="Filepath of output registry file (defaults to converting in place)",
+    type=click.Path(dir_okay=False, exists=False, path_type=Path),
+    required=False,
+)
+@click.option(
+    "--expand",
+    help="Convert a compact registry back to the verbose format",
+    is_flag=True,
+    default=False,
+)
+@click.option(
+    "--selectors/--no-selectors",
+    help="Add (or remove) the selector and topic tables of each entry (defaults to preserving)",
+    default=None,
+)
+def cli(registry, output_registry, expand, selectors):
+    """Convert a registry file to the compact format (deduplicated ABIs), or back."""
+    output_registry = output_registry or registry
+    convert_registry(
+        filepath=registry,
+        output_filepath=output_registry,
+        compact=not expand,
+        selectors=selectors,
+    )
+    print(f"Converted registry at {registry} to {output_registry}.")
@@ -0,0 +1,55 @@
+#!/usr/bin/python3
+import json
+import sys
+from pathlib import Path
+
+import click
+
+from deployment.registry import diff_registries, read_registry
+
+
+@click.command()
+@click.option(
+    "--registry-1",
+    help="Filepath to registry file 1",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    required=True,
+)
+@click.option(
+    "--registry-2",
+    help="Filepath to registry file 2",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    required=True,
+)
+@click.option(
+    "--chain-id",
+    help="Only compare entries on this chain id",
+    type=int,
+    required=False,
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Filepath of the JSON report (defaults to stdout)",
+    type=click.Path(dir_okay=False, exists=False, path_type=Path),
+    required=False,
+)
+def cli(registry_1, registry_2, chain_id, output):
+    """Structurally compare two registry files; exits with status 1 if they differ."""
+    entries_1 = read_registry(filepath=registry_1)
+    entries_2 = read_registry(filepath=registry_2)
+    if chain_id is not None:
+        entries_1 = [entry for entry in entries_1 if entry.chain_id == chain_id]
+        entries_2 = [entry for entry in entries_2 if entry.chain_id == chain_id]
+
+    diffs = diff_registries(entries_1, entries_2)
+    report = json.dumps([diff.to_dict() for diff in diffs.values()], indent=4)
+    if output:
+        with open(output, "w") as file:
+            file.write(report)
+        print(f"Registry diff written to {output}")
+    else:
+        print(report)
+
+    if diffs:
+        sys.exit(1)
@@ -0,0 +1,53 @@
+#!/usr/bin/python3
+# Usage:
+#  > ape run estimate_deployment --constructor-params <path/to/constructor_params.yml>
+
+import json
+from pathlib import Path
+
+import click
+from ape import accounts, networks
+
+from deployment.costs import WEI_PER_GWEI
+from deployment.params import Deployer
+
+
+@click.command()
+@click.option(
+    "--constructor-params",
+    help="Filepath to the constructor parameters YAML of the deployment",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    required=True,
+)
+@click.option(
+    "--gas-price",
+    help="Gas price (in gwei) at which the deployment cost is estimated",
+    type=float,
+    default=30,
+)
+@click.option(
+    "--output",
+    "-o",
+    help="Filepath to write the cost report to (as JSON)",
+    type=click.Path(dir_okay=False, exists=False, path_type=Path),
+    required=False,
+)
+def cli(constructor_params, gas_price, output):
+    """Dry-run a deployment on a local in-memory chain and report its gas usage and cost."""
+    gas_price = int(gas_price * WEI_PER_GWEI)
+    with networks.ethereum.local.use_provider("test"):
+        deployer = Deployer.from_yaml(
+            filepath=constructor_params,
+            verify=False,
+            account=accounts.test_accounts[0],
+            autosign=True,
+            dry_run=True,
+        )
+        deployer.deploy_all()
+
+    report = deployer.cost_report
+    print(f"\n{report.format(gas_price)}")
+    if output:
+        with open(output, "w") as file:
+            json.dump(report.to_dict(gas_price), file, indent=4)
+        print(f"Cost report written to {output}.")
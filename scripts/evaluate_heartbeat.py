@@ -1,17 +1,17 @@
 #!/usr/bin/python3
 
+import functools
 import json
+import os
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
 import click
 import requests
-import urllib3
-from ape import chain
 from ape.cli import ConnectedProviderCommand, network_option
 from ape.contracts import ContractInstance
-from ape.contracts.base import ContractContainer
 from packaging.version import InvalidVersion, Version
 
 from deployment import registry
@@ -21,13 +21,21 @@ from deployment.constants import (
     SUPPORTED_TACO_DOMAINS,
     RitualState,
 )
-
-# Disable SSL warnings for self-signed certificates
-urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
+from deployment.heartbeat_history import (
+    HEARTBEAT_HISTORY_FILENAME,
+    HeartbeatHistory,
+    ParticipantRecord,
+)
+from deployment.http_cache import cached_get
+from deployment.multicall import ContractRead, get_balances, get_block_number, multicall
+from deployment.nodes import KnownNodes
 
 NODE_UPDATE_GRACE_PERIOD = timedelta(weeks=3)
 
+# Seconds during which cached HTTP responses are used without revalidation
+RELEASES_CACHE_TTL = 3600
+NETWORK_DATA_CACHE_TTL = 60
+
 # Reasons for node being an offender
 UNREACHABLE = "Node is unreachable"
 OUTDATED = "Node is running an outdated version"
@@ -35,14 +43,16 @@ UNRECOGNIZED_VERSION = "Unrecognized version"
 MISSING_TRANSCRIPT = "Missing transcript"
 
 
-def get_eth_balance(address: str) -> float:
-    """Fetches the ETH balance of a given address using eth-ape."""
+def get_eth_balances(addresses: List[str], block_number: int) -> Dict[str, float]:
+    """Fetches the ETH balances of the given addresses in one batch request."""
+    addresses = [address for address in dict.fromkeys(addresses) if address != "Unknown"]
     try:
-        balance_wei = chain.provider.get_balance(address)
-        return balance_wei / 1e18  # Convert from Wei to ETH
+        balances_wei = get_balances(addresses, block_identifier=block_number)
     except Exception as e:
-        click.secho(f"⚠️ Failed to fetch balance for {address}: {e}", fg="red")
-        return 0.0
+        click.secho(f"⚠️ Failed to fetch balances for {', '.join(addresses)}: {e}", fg="red")
+        return dict()
+    # Convert from Wei to ETH
+    return {address: balance / 1e18 for address, balance in zip(addresses, balances_wei)}
 
 
 def get_taco_network_data(domain) -> Dict[str, Any]:
@@ -50,7 +60,13 @@ def get_taco_network_data(domain) -> Dict[str, Any]:
     domain_api = NETWORK_SEEDNODE_STATUS_JSON_URI.get(domain)
 
     try:
-        response = requests.get(domain_api, params={"json": "true"}, verify=False, timeout=20)
+        response = cached_get(
+            domain_api,
+            params={"json": "true"},
+            ttl=NETWORK_DATA_CACHE_TTL,
+            verify=False,
+            timeout=20,
+        )
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
@@ -58,51 +74,81 @@ def get_taco_network_data(domain) -> Dict[str, Any]:
         return {"known_nodes": []}  # Return an empty structure to avoid crashes
 
 
-def get_operator(staker_address: str, taco_application: ContractContainer) -> str:
-    """Retrieves the operator address of a staker."""
+def get_operators(
+    staker_addresses: List[str], taco_application: ContractInstance, block_number: int
+) -> Dict[str, str]:
+    """Retrieves the operator addresses of the given stakers in one multicall."""
+    reads = [
+        ContractRead(taco_application, "stakingProviderInfo", (staker_address,))
+        for staker_address in staker_addresses
+    ]
     try:
-        info = taco_application.stakingProviderInfo(staker_address)
-        return info.operator
+        infos = multicall(reads, block_identifier=block_number)
     except Exception as e:
-        click.secho(f"⚠️ Failed to fetch operator for {staker_address}: {e}", fg="red")
-        return "Unknown"
-
-
-def get_node_version(staker_address: str, network_data: Dict[str, Any]) -> str:
-    # if this node is the one that provided the network data, return it directly
-    if network_data.get("staker_address") == staker_address:
-        return network_data.get("version", UNREACHABLE)
-    else:
-        nodes = network_data["known_nodes"]
-        for node in nodes:
-            if node.get("staker_address") == staker_address:
-                rest_url = node["rest_url"]
-                try:
-                    node_status = requests.get(
-                        f"https://{rest_url}/status/",
-                        params={"json": "true"},
-                        verify=False,
-                        timeout=30,
-                    )
-
-                    # check for HTTP errors (4xx and 5xx)
-                    node_status.raise_for_status()
+        click.secho(f"⚠️ Failed to fetch operators: {e}", fg="red")
+        infos = [None] * len(staker_addresses)
+
+    operators = dict()
+    for staker_address, info in zip(staker_addresses, infos):
+        if info is None:
+            click.secho(f"⚠️ Failed to fetch operator for {staker_address}", fg="red")
+            operators[staker_address] = "Unknown"
+        else:
+            operators[staker_address] = info.operator
+    return operators
 
-                    return node_status.json().get("version", UNREACHABLE)
-                except (
-                    requests.ConnectionError,
-                    requests.exceptions.ReadTimeout,
-                    requests.HTTPError,
-                ):
-                    return UNREACHABLE
 
-        return UNREACHABLE
+def get_rituals_data(
+    coordinator: ContractInstance, ritual_ids: List[str], block_number: int
+) -> Dict[str, Tuple[int, List[Any], int]]:
+    """
+    Retrieves the state, participants and initialization timestamp of the given rituals
+    in one multicall.
+    """
+    methods = ("getRitualState", "getParticipants", "getTimestamps")
+    reads = [
+        ContractRead(coordinator, method, (int(ritual_id),))
+        for ritual_id in ritual_ids
+        for method in methods
+    ]
+    results = multicall(reads, block_identifier=block_number)
+
+    rituals_data = dict()
+    for index, ritual_id in enumerate(ritual_ids):
+        start = len(methods) * index
+        ritual_status, participants, timestamps = results[start : start + len(methods)]
+        if ritual_status is None or participants is None or timestamps is None:
+            raise ValueError(f"Call to the coordinator failed for ritual {ritual_id}")
+        init_timestamp, _ = timestamps
+        rituals_data[ritual_id] = (ritual_status, participants, init_timestamp)
+    return rituals_data
+
+
+@functools.lru_cache(maxsize=None)
+def get_known_nodes(domain: str) -> KnownNodes:
+    """Returns the index of the known nodes of the TACo network, fetched once per run."""
+    return KnownNodes(get_taco_network_data(domain))
+
+
+def get_node_versions(staker_addresses: List[str], known_nodes: KnownNodes) -> Dict[str, str]:
+    """
+    Returns the versions of the nodes of the given staking providers, probing the status
+    of every distinct node once and concurrently.
+    """
+    click.secho(f"Probing the status of up to {len(set(staker_addresses))} nodes...", fg="cyan")
+    versions = known_nodes.get_versions(staker_addresses)
+    return {address: version or UNREACHABLE for address, version in versions.items()}
 
 
 def get_valid_versions() -> List[Version]:
     """Fetches valid versions considering the update grace period."""
     releases_url = "https://api.github.com/repos/nucypher/nucypher/releases"
-    releases_response = requests.get(releases_url)
+    headers = {"Accept": "application/vnd.github+json"}
+    if os.environ.get("GITHUB_TOKEN"):
+        headers["Authorization"] = f"Bearer {os.environ['GITHUB_TOKEN']}"
+    releases_response = cached_get(
+        releases_url, ttl=RELEASES_CACHE_TTL, headers=headers, timeout=30
+    )
     releases_response.raise_for_status()
     releases_response = releases_response.json()
 
@@ -138,8 +184,8 @@ def get_valid_versions() -> List[Version]:
 
 def get_heartbeat_round_info(
     coordinator: ContractInstance, heartbeat_rituals: Dict[str, Any]
-) -> tuple[int, str]:
-    """Calculate the current heartbeat round number and month name."""
+) -> tuple[int, str, str]:
+    """Calculate the current heartbeat round number, month name and period (year-month)."""
 
     def mondays_passed(date: datetime) -> int:
         """
@@ -171,8 +217,9 @@ def get_heartbeat_round_info(
 
     round = mondays_passed(ritual_start_time)
     month = ritual_start_time.strftime("%B")
+    period = ritual_start_time.strftime("%Y-%m")
 
-    return round, month
+    return round, month, period
 
 
 def format_discord_message(
@@ -286,7 +333,20 @@ def format_discord_message(
     is_flag=True,
     default=False,
 )
-def cli(domain: str, artifact: Any, include_5th_heartbeat: bool, report_infractions: bool) -> None:
+@click.option(
+    "--history",
+    "history_filepath",
+    help="The filepath of the heartbeat history database (created if missing).",
+    type=click.Path(dir_okay=False, path_type=Path),
+    default=HEARTBEAT_HISTORY_FILENAME,
+)
+def cli(
+    domain: str,
+    artifact: Any,
+    include_5th_heartbeat: bool,
+    report_infractions: bool,
+    history_filepath: Path,
+) -> None:
     """
     Evaluates the heartbeat artifact and analyzes offenders.
     This script is intended to be run shortly after a DKG heartbeat timeout to
@@ -317,7 +377,7 @@ def cli(domain: str, artifact: Any, include_5th_heartbeat: bool, report_infracti
 
     offenders: Dict[str, Dict[str, Any]] = defaultdict(dict)
 
-    heartbeat_round, month_name = get_heartbeat_round_info(coordinator, artifact_data)
+    heartbeat_round, month_name, period = get_heartbeat_round_info(coordinator, artifact_data)
     if heartbeat_round > 4 and not include_5th_heartbeat:
         click.secho(
             f"⚠️ This is the heartbeat round #{heartbeat_round}, which exceeds"
@@ -327,17 +387,26 @@ def cli(domain: str, artifact: Any, include_5th_heartbeat: bool, report_infracti
         click.secho("Skipping heartbeat evaluation...", fg="yellow")
         return
 
-    network_data = get_taco_network_data(domain)
+    # rituals evaluated by an earlier run are taken from the history as they were
+    history = HeartbeatHistory(history_filepath)
+    evaluated_ritual_ids = history.get_evaluated_rituals(domain, artifact_data)
+    new_ritual_ids = [r for r in artifact_data if int(r) not in evaluated_ritual_ids]
+    if evaluated_ritual_ids:
+        click.secho(
+            f"Skipping {len(evaluated_ritual_ids)} rituals already evaluated in {history_filepath}",
+            fg="cyan",
+        )
 
-    for ritual_id, _ in artifact_data.items():
-        try:
-            ritual_status = coordinator.getRitualState(ritual_id)
-            participants = coordinator.getParticipants(ritual_id)
-            init_timeout_timestamp, _ = coordinator.getTimestamps(ritual_id)
-        except Exception as e:
-            click.secho(f"⚠️ Failed to fetch ritual data for {ritual_id}: {e}", fg="red")
-            return
+    # all on-chain data of the heartbeat is read at the same block
+    block_number = get_block_number()
+    try:
+        rituals_data = get_rituals_data(coordinator, new_ritual_ids, block_number)
+    except Exception as e:
+        click.secho(f"⚠️ Failed to fetch ritual data: {e}", fg="red")
+        return
 
+    rituals = dict()
+    for ritual_id, (ritual_status, participants, init_timeout_timestamp) in rituals_data.items():
         # let's check if we gave enough time to timeout: no rituals in progress
         init_timeout = datetime.fromtimestamp(init_timeout_timestamp, tz=timezone.utc)
         if init_timeout + dkg_timeout > datetime.now(tz=timezone.utc):
@@ -348,10 +417,22 @@ def cli(domain: str, artifact: Any, include_5th_heartbeat: bool, report_infracti
             )
             return
 
+        rituals[ritual_id] = (ritual_status, participants, init_timeout_timestamp)
+
+    # probe every node of every heartbeat ritual at once
+    known_nodes = get_known_nodes(domain)
+    staker_addresses = [
+        participant_info[0]
+        for _, participants, _ in rituals.values()
+        for participant_info in participants
+    ]
+    node_versions = get_node_versions(staker_addresses, known_nodes)
+
+    for ritual_id, (ritual_status, participants, _) in rituals.items():
         for participant_info in participants:
             address, _, transcript, _ = participant_info
 
-            version = get_node_version(address, network_data)
+            version = node_versions[address]
 
             offenders[address] = {"ritual": ritual_id, "reasons": [], "version": version}
 
@@ -385,15 +466,49 @@ def cli(domain: str, artifact: Any, include_5th_heartbeat: bool, report_infracti
                     offenders[address]["reasons"].append(MISSING_TRANSCRIPT)
                     click.secho(f"Node {address} didn't send transcript", fg="cyan")
 
-            # Fetch additional offender details for the report
-            if offenders[address]["reasons"]:
-                operator_address = get_operator(address, taco_application=taco_application)
-                offenders[address]["operator"] = operator_address
-                offenders[address]["eth_balance"] = get_eth_balance(operator_address)
-            else:
+            if not offenders[address]["reasons"]:
                 # Remove non-offenders
                 offenders.pop(address, None)
 
+    # Fetch additional offender details for the report
+    operators = get_operators(list(offenders), taco_application, block_number)
+    eth_balances = get_eth_balances(list(operators.values()), block_number)
+    for address, operator_address in operators.items():
+        offenders[address]["operator"] = operator_address
+        offenders[address]["eth_balance"] = eth_balances.get(operator_address, 0.0)
+
+    # Record the new rituals, then add the offenders of those evaluated before
+    for ritual_id, (ritual_status, participants, init_timestamp) in rituals.items():
+        participant_records = list()
+        for participant_info in participants:
+            address = participant_info[0]
+            offender = offenders.get(address, dict())
+            if offender and offender["ritual"] != ritual_id:
+                offender = dict()  # an offense in another ritual of this heartbeat
+            node_status = known_nodes.get_status(address)
+            participant_records.append(
+                ParticipantRecord(
+                    staker_address=address,
+                    version=node_versions[address],
+                    reasons=offender.get("reasons", []),
+                    probe_latency=node_status.latency if node_status else None,
+                    operator=offender.get("operator"),
+                    eth_balance=offender.get("eth_balance"),
+                )
+            )
+        history.record_ritual(
+            domain=domain,
+            ritual_id=int(ritual_id),
+            heartbeat_round=heartbeat_round,
+            period=period,
+            init_timestamp=init_timestamp,
+            state=ritual_status,
+            participants=participant_records,
+            block_number=block_number,
+        )
+    for address, offender in history.get_offenders(domain, evaluated_ritual_ids).items():
+        offenders[address] = dict(offender, ritual=str(offender["ritual"]))
+
     # Save offenders before network investigation
     with open("offenders.json", "w") as f:
         json.dump(offenders, f, indent=4)
@@ -420,6 +535,16 @@ def cli(domain: str, artifact: Any, include_5th_heartbeat: bool, report_infracti
     click.secho(f"  - Outdated nodes: {outdated_nodes}")
     click.secho(f"  - Nodes with missing transcripts: {missing_transcripts}")
 
+    repeat_offenders = history.get_repeat_offenders(domain, period=period)
+    history.close()
+    if repeat_offenders:
+        click.secho(f"Repeat offenders in {month_name}:")
+        for repeat_offender in repeat_offenders:
+            click.secho(
+                f"  - {repeat_offender.staker_address} (operator {repeat_offender.operator}): "
+                f"{len(repeat_offender.rituals)} rituals, {', '.join(repeat_offender.reasons)}"
+            )
+
     # Generate and display Discord message
     latest_version = str(valid_versions[0])
     discord_message = format_discord_message(offenders, heartbeat_round, month_name, latest_version)
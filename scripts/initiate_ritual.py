@@ -1,7 +1,6 @@
 #!/usr/bin/python3
 import json
 import os
-import time
 from contextlib import suppress
 
 import click
@@ -14,7 +13,8 @@ from deployment.constants import (
     HEARTBEAT_ARTIFACT_FILENAME,
     SUPPORTED_TACO_DOMAINS,
 )
-from deployment.params import Transactor
+from deployment.params import BatchCall, Transactor
+from deployment.pipeline import TransactionPipeline
 from deployment.types import ChecksumAddress, MinInt
 from deployment.utils import check_plugins, get_heartbeat_cohorts, sample_nodes
 
@@ -224,26 +224,33 @@ def cli(
             )
         cohorts = [cohort]
 
-    rituals = {}
-    for cohort in cohorts:
-        # TODO: Failure recovery? (not enough funds, outages, etc.)
-        # Initiate the ritual(s)
-        transactor = Transactor(account=account, autosign=auto)
-        try:
-            result = transactor.transact(
+    # Initiate the ritual(s), submitting all of them without waiting for each receipt
+    # TODO: Failure recovery? (not enough funds, outages, etc.)
+    transactor = Transactor(account=account, autosign=auto)
+    try:
+        calls = [
+            BatchCall(
                 coordinator_contract.initiateRitual,
-                fee_model_contract.address,
-                cohort,
-                authority,
-                duration,
-                access_controller_contract.address,
+                (
+                    fee_model_contract.address,
+                    cohort,
+                    authority,
+                    duration,
+                    access_controller_contract.address,
+                ),
             )
-        except Exception as e:
-            raise click.ClickException(f"Failed to initiate ritual.\n{e}")
+            for cohort in cohorts
+        ]
+        receipts = TransactionPipeline(transactor).run(calls)
+    except Exception as e:
+        raise click.ClickException(f"Failed to initiate ritual.\n{e}")
 
-        ritual_id = result.events[0].ritualId
+    rituals = {}
+    for cohort, receipt in zip(cohorts, receipts):
+        if receipt.failed:
+            raise click.ClickException(f"Failed to initiate ritual in {receipt.txn_hash}.")
+        ritual_id = receipt.events[0].ritualId
         rituals[ritual_id] = cohort
-        time.sleep(1)  # chill for a sec
 
     # Save the ritual data
     if heartbeat:
@@ -8,7 +8,7 @@ import click
 from ape.cli import ConnectedProviderCommand
 
 from deployment.constants import SUPPORTED_TACO_DOMAINS
-from deployment.registry import read_registry, RegistryEntry
+from deployment.registry import ChainId, ContractName, iter_registry_addresses
 from deployment.utils import get_chain_name, registry_filepath_from_domain
 
 
@@ -17,30 +17,33 @@ def _format_chain_name(chain_name: str) -> str:
     return "/".join(word.capitalize() for word in chain_name.split())
 
 
-def _get_registry_entries(domain: Optional[str] = None) -> List[Tuple[str, List[RegistryEntry]]]:
-    """Parse the registry files for the given domain or all supported domains."""
+RegistryAddress = Tuple[ChainId, ContractName, str]
+
+
+def _get_registry_entries(domain: Optional[str] = None) -> List[Tuple[str, List[RegistryAddress]]]:
+    """Parse the registry files (without ABIs) for the given domain or all supported domains."""
     registry_entries = list()
     for taco_domain in SUPPORTED_TACO_DOMAINS:
         if domain and domain != taco_domain:
             continue
         registry_filepath = registry_filepath_from_domain(domain=taco_domain)
-        entries = read_registry(filepath=registry_filepath)
+        entries = list(iter_registry_addresses(filepath=registry_filepath))
         registry_entries.append((taco_domain, entries))
     return registry_entries
 
 
-def _display_registry_entries(registry_entries: List[Tuple[str, List[RegistryEntry]]]) -> None:
+def _display_registry_entries(registry_entries: List[Tuple[str, List[RegistryAddress]]]) -> None:
     """Display registry entries grouped by chain ID."""
     for domain, entries in registry_entries:
-        grouped_entries = groupby(entries, key=lambda e: e.chain_id)
+        grouped_entries = groupby(entries, key=lambda e: e[0])
         click.secho(f"\n{domain.capitalize()} Domain", fg="green")
 
         for chain_id, chain_entries in grouped_entries:
             chain_name = _format_chain_name(get_chain_name(chain_id))
             click.secho(f"    {chain_name}", fg="yellow")
 
-            for index, entry in enumerate(chain_entries, start=1):
-                click.secho(f"        {index}. {entry.name} {entry.address}", fg="cyan")
+            for index, (_, name, address) in enumerate(chain_entries, start=1):
+                click.secho(f"        {index}. {name} {address}", fg="cyan")
 
 
 @click.command(cls=ConnectedProviderCommand, name="list-contracts")
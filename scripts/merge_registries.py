@@ -1,8 +1,20 @@
 #!/usr/bin/python3
+import json
 from pathlib import Path
 
 import click
-from deployment.registry import merge_registries
+
+from deployment.registry import MergeStrategy, merge_registry_files
+
+
+def _parse_overrides(ctx, param, value):
+    overrides = dict()
+    for override in value:
+        name, separator, filepath = override.partition("=")
+        if not separator:
+            raise click.BadParameter(f"Expected NAME=REGISTRY, got '{override}'")
+        overrides[name] = Path(filepath)
+    return overrides
 
 
 @click.command()
@@ -10,13 +22,22 @@ from deployment.registry import merge_registries
     "--registry-1",
     help="Filepath to registry file 1",
     type=click.Path(dir_okay=False, exists=True, path_type=Path),
-    required=True,
+    required=False,
 )
 @click.option(
     "--registry-2",
     help="Filepath to registry file 2",
     type=click.Path(dir_okay=False, exists=True, path_type=Path),
-    required=True,
+    required=False,
+)
+@click.option(
+    "--registry",
+    "-r",
+    "registries",
+    help="Filepath to an additional registry file (in merge order)",
+    type=click.Path(dir_okay=False, exists=True, path_type=Path),
+    required=False,
+    multiple=True,
 )
 @click.option(
     "--output-registry",
@@ -33,11 +54,58 @@ from deployment.registry import merge_registries
     required=False,
     multiple=True,
 )
-def cli(registry_1, registry_2, output_registry, deprecated_contracts):
-    """Merge two registry entries into one."""
-    merge_registries(
-        registry_1_filepath=registry_1,
-        registry_2_filepath=registry_2,
+@click.option(
+    "--strategy",
+    help="How to resolve conflicting entries for the same contract name and chain",
+    type=click.Choice([strategy.value for strategy in MergeStrategy]),
+    default=MergeStrategy.NEWEST.value,
+    show_default=True,
+)
+@click.option(
+    "--override",
+    "overrides",
+    help="Take the entry for a contract name from a specific registry, as NAME=REGISTRY",
+    required=False,
+    multiple=True,
+    callback=_parse_overrides,
+)
+@click.option(
+    "--conflicts-report",
+    help="Filepath of a JSON report of all conflicts and how they were resolved",
+    type=click.Path(dir_okay=False, exists=False, path_type=Path),
+    required=False,
+)
+def cli(
+    registry_1,
+    registry_2,
+    registries,
+    output_registry,
+    deprecated_contracts,
+    strategy,
+    overrides,
+    conflicts_report,
+):
+    """Merge any number of registry files into one."""
+    registry_filepaths = [r for r in (registry_1, registry_2) if r] + list(registries)
+    if len(registry_filepaths) < 2:
+        raise click.UsageError("At least two registries must be provided.")
+
+    _, conflicts = merge_registry_files(
+        registry_filepaths=registry_filepaths,
         output_filepath=output_registry,
+        strategy=MergeStrategy(strategy),
+        overrides=overrides,
         deprecated_contracts=deprecated_contracts,
     )
+
+    report = [conflict.to_dict() for conflict in conflicts]
+    for conflict in report:
+        selected = conflict["selected"]
+        print(
+            f"! Conflict for {conflict['name']} on chain id {conflict['chain_id']}: "
+            f"using {selected['address']} from {selected['registry']} ({conflict['resolution']})"
+        )
+    if conflicts_report:
+        with open(conflicts_report, "w") as file:
+            json.dump(report, file, indent=4)
+        print(f"Conflicts report written to {conflicts_report}")
@@ -3,11 +3,10 @@
 
 from ape import accounts, chain, networks, project
 
+import deployment.constants
 from deployment.constants import CONSTRUCTOR_PARAMS_DIR
 from deployment.params import Deployer
 
-
-OZ_DEPENDENCY = project.dependencies["openzeppelin"]["5.0.0"]
 PROXY_ADMIN_ADDRESS = "0xeE711368eabA106A0cf7a07B33B84cD930331fFd"
 COORDINATOR_PROXY_ADDRESS = "0xE74259e3dafe30bAA8700238e324b47aC98FE755"
 CONSTRUCTOR_PARAMS_FILEPATH = CONSTRUCTOR_PARAMS_DIR / "mainnet" / "redeploy-coordinator.yml"
@@ -23,7 +22,7 @@ def main():
     chain.set_balance(nuco_multisig.address, "5 ether")
 
     # Ensure ProxyAdmin is as expected on mainnet
-    proxy_admin = OZ_DEPENDENCY.ProxyAdmin.at(PROXY_ADMIN_ADDRESS)
+    proxy_admin = deployment.constants.OZ_DEPENDENCY.ProxyAdmin.at(PROXY_ADMIN_ADDRESS)
     assert proxy_admin.owner() == nuco_multisig.address
 
     # Deploy new Coordinator implementation
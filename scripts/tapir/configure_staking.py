@@ -23,25 +23,28 @@ def configure_sepolia_root(transactor: Transactor) -> int:
         threshold_staking_contract = deployments[project.TestnetThresholdStaking.contract_type.name]
 
         min_stake_size = taco_application_contract.minimumAuthorization()
-        for staking_provider, operator in TAPIR_NODES.items():
-            # staking
-            transactor.transact(
-                threshold_staking_contract.setRoles,
-                staking_provider,
-                transactor.get_account().address,
-                staking_provider,
-                staking_provider,
-            )
-
-            transactor.transact(
-                threshold_staking_contract.authorizationIncreased,
-                staking_provider,
-                0,
-                min_stake_size,
-            )
-
-            # bonding
-            transactor.transact(taco_application_contract.bondOperator, staking_provider, operator)
+        with transactor.batch() as batch:
+            for staking_provider, operator in TAPIR_NODES.items():
+                # staking
+                batch.transact(
+                    threshold_staking_contract.setRoles,
+                    staking_provider,
+                    transactor.get_account().address,
+                    staking_provider,
+                    staking_provider,
+                )
+
+                batch.transact(
+                    threshold_staking_contract.authorizationIncreased,
+                    staking_provider,
+                    0,
+                    min_stake_size,
+                )
+
+        # bonding requires the stakes above, so it is a batch of its own
+        with transactor.batch() as batch:
+            for staking_provider, operator in TAPIR_NODES.items():
+                batch.transact(taco_application_contract.bondOperator, staking_provider, operator)
 
     return min_stake_size
 
@@ -57,16 +60,17 @@ def configure_amoy_root(transactor: Transactor, stake_size: int):
 
         mock_taco_application_contract = deployments[project.MockPolygonChild.contract_type.name]
 
-        for staking_provider, operator in TAPIR_NODES.items():
-            # staking
-            transactor.transact(
-                mock_taco_application_contract.updateAuthorization, staking_provider, stake_size
-            )
-
-            # bonding
-            transactor.transact(
-                mock_taco_application_contract.updateOperator, staking_provider, operator
-            )
+        with transactor.batch() as batch:
+            for staking_provider, operator in TAPIR_NODES.items():
+                # staking
+                batch.transact(
+                    mock_taco_application_contract.updateAuthorization, staking_provider, stake_size
+                )
+
+                # bonding
+                batch.transact(
+                    mock_taco_application_contract.updateOperator, staking_provider, operator
+                )
 
 
 def main():
@@ -21,10 +21,33 @@ export interface Contract {
 
 export type ContractRegistry = Record<string, Record<string, DeployedContract>>;
 
+// Compact registries deduplicate ABIs into this section and reference them by hash
+const COMPACT_REGISTRY_ABIS_KEY = "abis";
+
+export const expandRegistry = (registryJson: object): ContractRegistry => {
+  const { [COMPACT_REGISTRY_ABIS_KEY]: abis, ...chains } = registryJson as Record<
+    string,
+    Record<string, DeployedContract>
+  >;
+  if (!abis) {
+    return chains;
+  }
+
+  const registry: ContractRegistry = {};
+  for (const [chainId, contracts] of Object.entries(chains)) {
+    registry[chainId] = {};
+    for (const [name, contract] of Object.entries(contracts)) {
+      const abi = typeof contract.abi === "string" ? abis[contract.abi] : contract.abi;
+      registry[chainId][name] = { ...contract, abi };
+    }
+  }
+  return registry;
+};
+
 export const domainRegistry: Record<string, ContractRegistry> = {
-  lynx: lynxRegistryJson,
-  tapir: tapirRegistryJson,
-  mainnet: mainnetRegistryJson,
+  lynx: expandRegistry(lynxRegistryJson),
+  tapir: expandRegistry(tapirRegistryJson),
+  mainnet: expandRegistry(mainnetRegistryJson),
 };
 
 export type Domain = "mainnet" | "oryx" | "tapir" | "lynx";
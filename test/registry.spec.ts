@@ -1,6 +1,13 @@
 import { describe, expect, it } from "vitest";
 
-import { ChainId, type ContractName, contractNames, type Domain, getContract } from "../src";
+import {
+  ChainId,
+  type ContractName,
+  contractNames,
+  type Domain,
+  expandRegistry,
+  getContract,
+} from "../src";
 
 const testCases: Array<[string, number, ContractName]> = contractNames.flatMap((contract) => [
   ["lynx", 80002, contract],
@@ -40,4 +47,15 @@ describe("registry", () => {
     const contractAddress2 = getContract("tapir", 80002, "Coordinator");
     expect(contractAddress1).not.toEqual(contractAddress2);
   });
+
+  it("should expand compact registries", () => {
+    const abi = [{ type: "function", name: "foo", inputs: [], outputs: [] }];
+    const compact = {
+      abis: { "0x1234": abi },
+      "80002": { Coordinator: { address: "0xabcd", abi: "0x1234" } },
+    };
+    const registry = expandRegistry(compact);
+    expect(Object.keys(registry)).toEqual(["80002"]);
+    expect(registry["80002"]["Coordinator"].abi).toEqual(abi);
+  });
 });
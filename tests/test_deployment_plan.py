@@ -0,0 +1,91 @@
+from collections import OrderedDict
+
+import pytest
+from ape import chain
+
+from deployment.abi import abi_fingerprint
+from deployment.constants import CONSTRUCTOR_PARAMS_DIR
+from deployment.params import Deployer, DeploymentPlan
+from deployment.registry import read_registry, registry_from_ape_deployments
+from deployment.utils import _load_yaml
+
+
+def test_plan_groups_independent_contracts_into_stages():
+    plan = DeploymentPlan(
+        dependencies=OrderedDict(
+            Token=set(),
+            Application={"Token"},
+            Child=set(),
+            Coordinator={"Application", "Child"},
+            AllowList={"Coordinator"},
+        )
+    )
+    assert plan.stages == [["Token", "Child"], ["Application"], ["Coordinator"], ["AllowList"]]
+    assert plan.order == ["Token", "Child", "Application", "Coordinator", "AllowList"]
+
+
+def test_plan_preserves_config_order_within_stages():
+    plan = DeploymentPlan(dependencies=OrderedDict(C={"A"}, B={"A"}, A=set(), D=set(), E={"D"}))
+    assert plan.stages == [["A", "D"], ["C", "B", "E"]]
+
+
+def test_plan_rejects_cycles():
+    with pytest.raises(DeploymentPlan.Cycle, match="Contracts A, B have circular references"):
+        DeploymentPlan(dependencies=OrderedDict(A={"B"}, B={"A"}, C=set()))
+
+    with pytest.raises(DeploymentPlan.Cycle, match="Contracts A, B, C have circular references"):
+        DeploymentPlan(dependencies=OrderedDict(A={"C"}, B={"A"}, C={"B"}, D=set()))
+
+
+@pytest.fixture
+def child_config(tmp_path):
+    config = _load_yaml(CONSTRUCTOR_PARAMS_DIR / "ci" / "child.yml")
+    config["artifacts"] = {"dir": str(tmp_path)}
+    return config
+
+
+def test_plan_from_deployment_config(child_config, accounts):
+    child_config["artifacts"]["filename"] = "plan.json"
+    with chain.contracts.deployments.use_temporary_cache():
+        deployer = Deployer(
+            config=child_config, path=None, verify=False, account=accounts[0], autosign=True
+        )
+        plan = deployer.get_deployment_plan()
+
+    # the proxied contracts depend on their proxy parameters as well
+    assert plan.stages == [
+        ["MockPolygonChild", "LynxRitualToken"],
+        ["TACoChildApplication"],
+        ["Coordinator"],
+        ["GlobalAllowList"],
+    ]
+
+
+def _deploy_child(config, account, pipelined):
+    """Deploys the config on a fresh deployments cache, then reverts the chain."""
+    mode = "pipelined" if pipelined else "sequential"
+    config["artifacts"]["filename"] = f"{mode}.json"
+    snapshot = chain.snapshot()
+    with chain.contracts.deployments.use_temporary_cache():
+        deployer = Deployer(config=config, path=None, verify=False, account=account, autosign=True)
+        deployments = deployer.deploy_all(pipelined=pipelined)
+        registry_filepath = registry_from_ape_deployments(
+            deployments=list(deployments.values()), output_filepath=deployer.registry_filepath
+        )
+    chain.restore(snapshot)
+    return read_registry(registry_filepath)
+
+
+def test_pipelined_deployment_matches_sequential(child_config, accounts):
+    sequential_entries = _deploy_child(child_config, accounts[0], pipelined=False)
+    pipelined_entries = _deploy_child(child_config, accounts[0], pipelined=True)
+
+    def _summary(entries):
+        # deployments run from the same nonces, so they land at the same addresses;
+        # transaction hashes differ with the fee fields of the signed transactions
+        return sorted(
+            (e.chain_id, e.name, e.address, abi_fingerprint(e.abi), e.deployer) for e in entries
+        )
+
+    assert len(sequential_entries) == 5
+    assert _summary(pipelined_entries) == _summary(sequential_entries)
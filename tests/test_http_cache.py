@@ -0,0 +1,98 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from deployment.http_cache import HttpCache, HttpCacheMiss
+
+RELEASES = [{"tag_name": "v7.4.1"}, {"tag_name": "v7.4.0"}]
+ETAG = '"releases-v1"'
+
+
+class StubReleasesHandler(BaseHTTPRequestHandler):
+    """Serves a resource with an ETag, answering 304 to requests which revalidate it."""
+
+    full_responses = 0
+    not_modified_responses = 0
+
+    def do_GET(self):
+        if self.headers.get("If-None-Match") == ETAG:
+            StubReleasesHandler.not_modified_responses += 1
+            self.send_response(304)
+            self.end_headers()
+            return
+        StubReleasesHandler.full_responses += 1
+        payload = json.dumps(RELEASES).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def releases_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubReleasesHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/releases"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def reset_counts():
+    StubReleasesHandler.full_responses = 0
+    StubReleasesHandler.not_modified_responses = 0
+
+
+def test_fresh_response_is_served_from_cache(tmp_path, releases_url):
+    cache = HttpCache(directory=tmp_path, offline=False)
+    for _ in range(3):
+        response = cache.get(releases_url, ttl=60)
+        response.raise_for_status()
+        assert response.json() == RELEASES
+
+    assert StubReleasesHandler.full_responses == 1
+    assert StubReleasesHandler.not_modified_responses == 0
+
+
+def test_stale_response_is_revalidated(tmp_path, releases_url):
+    cache = HttpCache(directory=tmp_path, offline=False)
+    assert cache.get(releases_url, ttl=0).json() == RELEASES
+    assert cache.get(releases_url, ttl=0).json() == RELEASES
+    assert cache.get(releases_url, params={"page": 2}, ttl=0).json() == RELEASES
+
+    assert StubReleasesHandler.full_responses == 2  # parameters are part of the cache key
+    assert StubReleasesHandler.not_modified_responses == 1
+    assert not list(tmp_path.glob(".*"))  # no temporary files are left behind
+
+
+def test_offline_mode(tmp_path, releases_url):
+    HttpCache(directory=tmp_path, offline=False).get(releases_url)
+
+    offline_cache = HttpCache(directory=tmp_path, offline=True)
+    assert offline_cache.get(releases_url, ttl=0).json() == RELEASES
+    with pytest.raises(HttpCacheMiss):
+        offline_cache.get(releases_url, params={"page": 2})
+    assert StubReleasesHandler.full_responses == 1
+
+
+def test_stale_response_is_used_when_unreachable(tmp_path):
+    url = "http://127.0.0.1:1/releases"  # nothing listens there
+    cache = HttpCache(directory=tmp_path, offline=False)
+    with pytest.raises(requests.ConnectionError):
+        cache.get(url, timeout=1)
+
+    # seed the cache as if the server had been reachable before
+    (tmp_path / f"{cache._key(url, None)}.body").write_bytes(json.dumps(RELEASES).encode())
+    (tmp_path / f"{cache._key(url, None)}.json").write_text(
+        json.dumps({"url": url, "fetched_at": 0, "headers": {}})
+    )
+    assert cache.get(url, ttl=0, timeout=1).json() == RELEASES
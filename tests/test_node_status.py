@@ -0,0 +1,139 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from deployment.nodes import KnownNodes, probe_node_statuses
+
+SLOW_NODE_DELAY = 3
+
+
+class StubNodeHandler(BaseHTTPRequestHandler):
+    """Serves the status of healthy, slow and failing nodes, selected by the URL path prefix."""
+
+    requests_count = 0
+
+    def do_GET(self):
+        StubNodeHandler.requests_count += 1
+        node = self.path.split("/")[1]
+        if node == "slow":
+            time.sleep(SLOW_NODE_DELAY)
+        if node == "failing":
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = {"version": "7.4.1"} if node != "unversioned" else {}
+        if node == "garbled":
+            payload = b"not json"
+        else:
+            payload = json.dumps(body).encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except ConnectionError:
+            # the client gave up on a slow node
+            pass
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_node_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubNodeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_probe_healthy_and_failing_nodes(stub_node_server):
+    rest_urls = [f"{stub_node_server}/{node}" for node in ("healthy", "failing", "unversioned")]
+    rest_urls.append(f"{stub_node_server}/garbled")
+    rest_urls.append("127.0.0.1:1")  # nothing listens there
+
+    statuses = probe_node_statuses(rest_urls, scheme="http")
+
+    assert list(statuses) == rest_urls
+    assert statuses[rest_urls[0]].reachable
+    assert statuses[rest_urls[0]].version == "7.4.1"
+    for rest_url in rest_urls[1:]:
+        assert not statuses[rest_url].reachable
+        assert statuses[rest_url].error
+
+
+def test_probe_each_node_once(stub_node_server):
+    StubNodeHandler.requests_count = 0
+    rest_url = f"{stub_node_server}/healthy"
+
+    statuses = probe_node_statuses([rest_url] * 5, scheme="http")
+
+    assert list(statuses) == [rest_url]
+    assert StubNodeHandler.requests_count == 1
+
+
+def test_probe_slow_nodes_concurrently(stub_node_server):
+    rest_urls = [f"{stub_node_server}/slow/{i}" for i in range(8)]
+
+    start = time.monotonic()
+    statuses = probe_node_statuses(rest_urls, scheme="http", max_workers=8)
+    elapsed = time.monotonic() - start
+
+    assert all(status.version == "7.4.1" for status in statuses.values())
+    assert elapsed < 2 * SLOW_NODE_DELAY
+
+
+def test_probe_timeout_and_deadline(stub_node_server):
+    slow_node, healthy_node = f"{stub_node_server}/slow", f"{stub_node_server}/healthy"
+
+    # per-node timeout
+    statuses = probe_node_statuses([slow_node, healthy_node], scheme="http", read_timeout=0.5)
+    assert not statuses[slow_node].reachable
+    assert statuses[healthy_node].reachable
+
+    # overall deadline: slow nodes are not waited for
+    start = time.monotonic()
+    statuses = probe_node_statuses([slow_node, healthy_node], scheme="http", deadline=1)
+    assert time.monotonic() - start < SLOW_NODE_DELAY
+    assert not statuses[slow_node].reachable
+    assert "1s" in statuses[slow_node].error
+    assert statuses[healthy_node].reachable
+
+
+def test_known_nodes_index_and_memoized_versions(stub_node_server):
+    network_data = {
+        "staker_address": "0xSeed",
+        "version": "7.5.0",
+        "known_nodes": [
+            {"staker_address": "0xAAA", "operator_address": "0x111", "rest_url": "unused"},
+            {"staker_address": "0xaaa", "operator_address": "0x222", "rest_url": "duplicate"},
+            {
+                "staker_address": "0xBBB",
+                "operator_address": "0x333",
+                "rest_url": f"{stub_node_server}/healthy",
+            },
+            {"staker_address": "0xCCC", "rest_url": f"{stub_node_server}/failing"},
+        ],
+    }
+    known_nodes = KnownNodes(network_data, scheme="http")
+
+    assert len(known_nodes) == 3
+    assert known_nodes.get("0xaaa")["rest_url"] == "unused"
+    assert known_nodes.get_by_operator("0x333")["staker_address"] == "0xBBB"
+    assert known_nodes.get("0xDDD") is None
+
+    StubNodeHandler.requests_count = 0
+    versions = known_nodes.get_versions(["0xSeed", "0xBBB", "0xCCC", "0xDDD"])
+    assert versions == {"0xSeed": "7.5.0", "0xBBB": "7.4.1", "0xCCC": None, "0xDDD": None}
+    assert StubNodeHandler.requests_count == 2
+    assert not known_nodes.get_status("0xCCC").reachable
+
+    # nodes of later cohorts are only probed if they were not before
+    assert known_nodes.get_versions(["0xbbb", "0xCCC"]) == {"0xbbb": "7.4.1", "0xCCC": None}
+    assert StubNodeHandler.requests_count == 2
@@ -0,0 +1,176 @@
+import json
+
+import pytest
+
+from deployment.abi import abi_fingerprint
+from deployment.registry import (
+    ConflictResolution,
+    NoContractFound,
+    Registry,
+    RegistryEntry,
+    contracts_from_registry,
+    merge_registries,
+    merge_registry_entries,
+    normalize_registry,
+    read_registry,
+    write_registry,
+)
+
+# in canonical registry order, i.e. sorted by type and name
+ABI_A = [
+    {"type": "error", "name": "Unauthorized", "inputs": []},
+    {
+        "type": "event",
+        "name": "Transfer",
+        "anonymous": False,
+        "inputs": [
+            {"name": "from", "type": "address", "indexed": True},
+            {"name": "to", "type": "address", "indexed": True},
+            {"name": "value", "type": "uint256", "indexed": False},
+        ],
+    },
+    {
+        "type": "function",
+        "name": "transfer",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "to", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "bool"}],
+    },
+]
+
+ABI_B = [
+    {
+        "type": "function",
+        "name": "owner",
+        "stateMutability": "view",
+        "inputs": [],
+        "outputs": [{"name": "", "type": "address"}],
+    },
+]
+
+
+def _entry(chain_id, name, address, abi, block_number=1):
+    return RegistryEntry(
+        chain_id=chain_id,
+        name=name,
+        address=address,
+        abi=abi,
+        tx_hash=f"0x{block_number:064x}",
+        block_number=block_number,
+        deployer="0x" + "de" * 20,
+    )
+
+
+@pytest.fixture
+def registry_entries():
+    return [
+        _entry(1, "TokenA", "0x" + "11" * 20, ABI_A, block_number=10),
+        _entry(1, "Ownable", "0x" + "22" * 20, ABI_B, block_number=11),
+        _entry(137, "TokenA", "0x" + "33" * 20, ABI_A, block_number=20),
+    ]
+
+
+def test_write_registry_skips_unchanged_registry(tmp_path, registry_entries):
+    filepath = tmp_path / "registry.json"
+    write_registry(entries=list(registry_entries), filepath=filepath, silent=True)
+    modified = filepath.stat().st_mtime_ns
+
+    write_registry(entries=read_registry(filepath), filepath=filepath, overwrite=True, silent=True)
+    assert filepath.stat().st_mtime_ns == modified
+    assert sorted(read_registry(filepath)) == sorted(registry_entries)
+
+
+def test_normalize_registry_rewrites_non_canonical_sections(tmp_path, registry_entries):
+    canonical_filepath = tmp_path / "canonical.json"
+    write_registry(entries=list(registry_entries), filepath=canonical_filepath, silent=True)
+
+    # same data, with one chain section minified onto a single line
+    canonical = canonical_filepath.read_text()
+    section = json.loads(canonical)["137"]
+    encoded_section = json.dumps(section, indent=4, separators=(",", ": ")).replace("\n", "\n    ")
+    assert encoded_section in canonical
+    filepath = tmp_path / "registry.json"
+    filepath.write_text(canonical.replace(encoded_section, json.dumps(section)))
+    assert filepath.read_text() != canonical
+
+    normalize_registry(filepath)
+    assert filepath.read_text() == canonical
+
+
+def test_merge_treats_abi_change_as_conflict(tmp_path, registry_entries):
+    # a proxy upgrade keeps the address and deployment transaction, with a new ABI
+    token, ownable, _ = registry_entries
+    upgraded_token = token._replace(abi=ABI_A + ABI_B)
+    registry_1, registry_2 = tmp_path / "registry_1.json", tmp_path / "registry_2.json"
+    write_registry(entries=[token, ownable], filepath=registry_1, silent=True)
+    write_registry(entries=[upgraded_token, ownable], filepath=registry_2, silent=True)
+
+    resolved = list()
+
+    def _resolver(candidates):
+        resolved.append([entry.name for _, entry in candidates])
+        return candidates[1]
+
+    merged, conflicts = merge_registry_entries(
+        registries=[
+            (registry_1, read_registry(registry_1)),
+            (registry_2, read_registry(registry_2)),
+        ],
+        conflict_resolver=_resolver,
+    )
+    assert resolved == [["TokenA", "TokenA"]]
+    assert [(conflict.name, conflict.resolution) for conflict in conflicts] == [
+        ("TokenA", "resolver")
+    ]
+    (merged_token,) = [entry for entry in merged if entry.name == "TokenA"]
+    assert abi_fingerprint(merged_token.abi) == abi_fingerprint(upgraded_token.abi)
+
+    output_filepath = merge_registries(
+        registry_1_filepath=registry_1,
+        registry_2_filepath=registry_2,
+        output_filepath=tmp_path / "merged.json",
+        force_conflict_resolution=ConflictResolution.USE_1,
+    )
+    (merged_token,) = [entry for entry in read_registry(output_filepath) if entry.name == "TokenA"]
+    assert abi_fingerprint(merged_token.abi) == abi_fingerprint(token.abi)
+
+
+def test_merge_rejects_unknown_override(tmp_path, registry_entries):
+    registry_1, registry_2 = tmp_path / "registry_1.json", tmp_path / "registry_2.json"
+    write_registry(entries=registry_entries[:1], filepath=registry_1, silent=True)
+    write_registry(entries=registry_entries[1:], filepath=registry_2, silent=True)
+    with pytest.raises(ValueError, match="does not name a merged registry"):
+        merge_registry_entries(
+            registries=[(registry_1, read_registry(registry_1)), (registry_2, [])],
+            overrides={"TokenA": tmp_path / "registry_3.json"},
+        )
+
+
+def test_registry_indexes(tmp_path, registry_entries):
+    filepath = tmp_path / "registry.json"
+    write_registry(entries=list(registry_entries), filepath=filepath, silent=True)
+    registry = Registry.from_file(filepath)
+
+    assert sorted(registry.chain_ids) == [1, 137]
+    assert registry.get_entry(chain_id=137, name="TokenA") == registry_entries[2]
+    assert [e.name for e in registry.chain_entries(1)] == ["Ownable", "TokenA"]
+    assert registry.get_entries_by_address("0x" + "22" * 20) == [registry_entries[1]]
+    assert registry.get_entries_by_address("0x" + "44" * 20) == []
+    with pytest.raises(NoContractFound):
+        registry.get_entry(chain_id=137, name="Ownable")
+
+    # parsed once per process
+    assert Registry.from_file(filepath) is registry
+    assert Registry.from_file(tmp_path / "." / "registry.json") is registry
+
+
+def test_contracts_from_registry_is_lazy(tmp_path, registry_entries):
+    filepath = tmp_path / "registry.json"
+    write_registry(entries=list(registry_entries), filepath=filepath, silent=True)
+
+    contracts = contracts_from_registry(filepath, chain_id=1)
+    assert list(contracts) == ["Ownable", "TokenA"]
+    assert len(contracts) == 2
+    assert "TokenA" in contracts
+    assert "Missing" not in contracts
+    assert not Registry.from_file(filepath)._instances  # nothing materialized